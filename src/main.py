@@ -33,8 +33,7 @@ def export_results(results, output_file_name):
     writer.write(results)
 
 def get_solver_results(model, objectives_input, parameters_input, list_of_sets, list_of_parameters, variables, settings):
-    objectives_input_ordered = objectives_input.sort_values(by='Priority')
-    priority_list = objectives_input_ordered['Priority'].unique()
+    priority_groups = list(objectives_input.groupby('Priority', sort=True))
     base_model = model
     
     # Create objective handler
@@ -56,29 +55,40 @@ def get_solver_results(model, objectives_input, parameters_input, list_of_sets,
             timeLimit=settings.solver.max_run_time,
             gapRel=settings.solver.gap_limit
         )
+
+    # Later priorities re-solve the same model with the previous optimum kept
+    # feasible by its bound, so start from it; SCIP_CMD takes no MIP start
+    warm_solver = solver
+    if settings.solver.solver_name != "SCIP":
+        warm_solver = type(solver)(path = settings.solver.solver_file_path,
+            timeLimit=settings.solver.max_run_time,
+            gapRel=settings.solver.gap_limit,
+            warmStart=True
+        )
     
-    for x in priority_list:
-        logging.info(f"Solving for objective {x} of {len(priority_list)}")
-        logging.info(f"Objective: {objectives_input_ordered[objectives_input_ordered['Priority'] == x]['Objective'].iloc[0]}")
+    for i, (x, current_objectives) in enumerate(priority_groups):
+        objectives = current_objectives['Objective'].tolist()
+        relaxations = current_objectives['Relaxation'].tolist()
+        logging.info(f"Solving for objective {x} of {len(priority_groups)}")
+        logging.info(f"Objective: {objectives[0]}")
         
-        is_multi_objective = len(objectives_input_ordered[objectives_input_ordered['Priority'] == x]) > 1
-        if x < max(priority_list):
-            model_w_objective = base_model.copy()
-            for m in objectives_input_ordered[objectives_input_ordered['Priority']==x]['Objective']:
-                objective_handler.set_single_objective(model_w_objective, m)
+        if i > 0:
+            solver = warm_solver
+        if i < len(priority_groups) - 1:
+            for m in objectives:
+                objective_handler.set_single_objective(base_model, m)
                     
             base_model = objective_handler.solve_and_set_constraint(
-                model_w_objective,
-                objectives_input_ordered[objectives_input_ordered['Priority']==x]['Objective'],
-                objectives_input_ordered[objectives_input_ordered['Priority']==x]['Relaxation'],
+                base_model,
+                objectives,
+                relaxations,
                 solver
             )
         else:
-            model_w_objective = base_model.copy()
-            for m in objectives_input_ordered[objectives_input_ordered['Priority']==x]['Objective']:
-                objective_handler.set_single_objective(model_w_objective, m)
+            for m in objectives:
+                objective_handler.set_single_objective(base_model, m)
                     
-            result = model_w_objective.solve(solver)
+            result = base_model.solve(solver)
             
     return result
 
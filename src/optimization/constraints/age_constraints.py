@@ -17,6 +17,7 @@ class AgeConstraints(BaseConstraint):
 
     def _build_age_receiving_constraints(self, model: pulp.LpProblem) -> None:
         """Build constraints for receiving volumes by age"""
+        departures_by_arrival = self._get_departures_by_arrival()
         for n_r, p, t, a in product(
             self.network_sets['RECEIVING_NODES'],
             self.network_sets['PRODUCTS'],
@@ -27,10 +28,7 @@ class AgeConstraints(BaseConstraint):
                 self.variables['vol_arrived_by_age'][n_r, p, t, a] == 
                 pulp.lpSum(
                     self.variables['vol_departed_by_age'][n_d, n_r, p, t2, a, m]
-                    for n_d in self.network_sets['DEPARTING_NODES']
-                    for m in self.network_sets['MODES']
-                    for t2 in self.network_sets['PERIODS']
-                    if int(t2) == int(t) - int(self.parameters['transport_periods'].get((n_d, n_r, m), 0))
+                    for n_d, m, t2 in departures_by_arrival.get((n_r, t), ())
                 )
             )
             model += (expr, f"Age_receiving_departure_equality_constraint_{n_r}_{p}_{t}_{a}")
@@ -140,7 +138,7 @@ class AgeConstraints(BaseConstraint):
             self.network_sets['AGES'],
             self.network_sets['NODEGROUPS']
         ):
-            if self.parameters['node_in_nodegroup'].get((n, g), 0) == 1:
+            if (n, g) in self.node_group_pairs:
                 if n not in self.network_sets['ORIGINS']:
                     if int(t) > 1 and int(a) > 0:
                         expr = (
@@ -182,7 +180,7 @@ class AgeConstraints(BaseConstraint):
             self.network_sets['AGES'],
             self.network_sets['NODEGROUPS']
         ):
-            if self.parameters['node_in_nodegroup'].get((n_d, g), 0) == 1:
+            if (n_d, g) in self.node_group_pairs:
                 if n_d not in self.network_sets['ORIGINS']:
                     if int(t) > 1 and int(a) > 0:
                         expr = (
@@ -320,7 +318,7 @@ class AgeConstraints(BaseConstraint):
                 self.network_sets['AGES'],
                 self.network_sets['NODEGROUPS']
             ):
-                if self.parameters['node_in_nodegroup'].get((d, g), 0) == 1:
+                if (d, g) in self.node_group_pairs:
                     expr = (
                         self.variables['demand_by_age'][d, p, t, a] <=
                         self.parameters['max_vol_by_age'].get((t, p, d, a, g), self.big_m)
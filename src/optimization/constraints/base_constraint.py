@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from itertools import product
+from numbers import Number
+from typing import Dict, Any, List, Tuple
 import pulp
 
 class BaseConstraint(ABC):
@@ -11,6 +13,189 @@ class BaseConstraint(ABC):
         self.parameters = parameters
         self.big_m = 999999999 # TODO: make this based on settings
 
+        # Periods are carried as strings; cache their integer value and predecessor
+        self.period_index = {t: int(t) for t in network_sets['PERIODS']}
+        self.previous_period = {t: str(i - 1) for t, i in self.period_index.items() if i > 1}
+        self.period_weight = {t: parameters['period_weight'].get(i, 1) for t, i in self.period_index.items()}
+
+        # (node, group) memberships, for set lookups in place of node_in_nodegroup.get(...) == 1
+        self.node_group_pairs = frozenset(
+            pair for pair, assigned in parameters['node_in_nodegroup'].items() if assigned == 1
+        )
+
+        # Node groups each node belongs to, in NODEGROUPS order
+        group_order = {g: i for i, g in enumerate(network_sets['NODEGROUPS'])}
+        self.groups_of_node = {}
+        for n, g in self.node_group_pairs:
+            if g in group_order:
+                self.groups_of_node.setdefault(n, []).append(g)
+        for groups in self.groups_of_node.values():
+            groups.sort(key=group_order.get)
+
+        # Member nodes of each node group, in NODES order
+        self.nodes_of_group = {}
+        for n in network_sets['NODES']:
+            for g in self.groups_of_node.get(n, ()):
+                self.nodes_of_group.setdefault(g, []).append(n)
+
+    def _get_departures_by_arrival(self) -> Dict[Tuple[str, str], List[Tuple[str, str, str]]]:
+        """Group departure lanes by where and when they arrive
+        
+        Returns:
+            Dictionary mapping (receiving node, arrival period) to the
+            (departing node, mode, departure period) triples arriving then
+        """
+        period_of_index = {i: t for t, i in self.period_index.items()}
+        departures_by_arrival = {}
+        for n_d, n_r, m in product(
+            self.network_sets['DEPARTING_NODES'],
+            self.network_sets['RECEIVING_NODES'],
+            self.network_sets['MODES']
+        ):
+            transit = int(self.parameters['transport_periods'].get((n_d, n_r, m), 0))
+            for t, i in self.period_index.items():
+                t2 = period_of_index.get(i - transit)
+                if t2 is not None:
+                    departures_by_arrival.setdefault((n_r, t), []).append((n_d, m, t2))
+        return departures_by_arrival
+
+    def _get_release_periods(self, *shift_tables: Dict) -> Dict[Tuple[str, str, str, str], List[str]]:
+        """Group processing periods by the period in which their volume is released
+        
+        Volume processed in period t2 is released int(t2) + shift periods
+        later, where the shift sums the (period, node, product, node group)
+        entries of shift_tables. Only the sparse entries with a nonzero shift
+        are indexed; look up with released.get((n, p, g, t), (t,)) so that
+        every other period releases in the period it was processed.
+        
+        Returns:
+            Dictionary mapping (node, product, node group, period) to the
+            processing periods released in that period
+        """
+        period_of_index = {i: t for t, i in self.period_index.items()}
+        shifts = {}
+        for table in shift_tables:
+            for (t2, n, p, g), periods in table.items():
+                if t2 in self.period_index:
+                    shifts[t2, n, p, g] = shifts.get((t2, n, p, g), 0) + int(periods)
+
+        moved = {
+            (n, p, g, t2): period_of_index.get(self.period_index[t2] + shift)
+            for (t2, n, p, g), shift in shifts.items() if shift != 0
+        }
+        released = {}
+        for (n, p, g, t2), t in moved.items():
+            if t is not None:
+                key = (n, p, g, t)
+                released.setdefault(key, [] if key in moved else [t]).append(t2)
+        for key in moved:
+            released.setdefault(key, [])
+        return released
+
+    def _get_window_periods(self, windows: Dict[Tuple[Any, str], Any]) -> Dict[Tuple[Any, str], List[str]]:
+        """Group periods by the later periods their window covers
+        
+        Period t2 counts toward every period t with int(t2) < int(t) <=
+        int(t2) + window, where windows maps (key, t2) to the window length.
+        Only nonzero windows are indexed; look up with
+        covered.get((key, t), ()).
+        
+        Returns:
+            Dictionary mapping (key, period) to the earlier periods whose
+            window covers it, in PERIODS order
+        """
+        period_of_index = {i: t for t, i in self.period_index.items()}
+        covered = {}
+        for (key, t2), window in windows.items():
+            if t2 in self.period_index:
+                start = self.period_index[t2]
+                for i in range(start + 1, start + int(window) + 1):
+                    if i in period_of_index:
+                        covered.setdefault((key, period_of_index[i]), []).append(t2)
+        for periods in covered.values():
+            periods.sort(key=self.period_index.get)
+        return covered
+
+    @staticmethod
+    def _insert_constraint(model: pulp.LpProblem, constraint: pulp.LpConstraint) -> None:
+        """Insert a named constraint straight into model.constraints
+        
+        Bypasses LpProblem.addConstraint, which re-collects the variables of
+        every constraint as it is added. PuLP gathers them again from the
+        constraints when the model is written out.
+        
+        A row whose coefficients are all zero and whose constant already
+        satisfies the sense holds for every solution and is left out.
+        """
+        if constraint.name in model.constraints:
+            raise pulp.PulpError(f"overlapping constraint names: {constraint.name}")
+        if not any(constraint.values()):
+            if constraint.sense == pulp.LpConstraintEQ:
+                if constraint.constant == 0:
+                    return
+            elif constraint.constant * constraint.sense >= 0:
+                return
+        model.constraints[constraint.name] = constraint
+
+    @classmethod
+    def _add_constraint(cls, model: pulp.LpProblem, expr: Any, sense: int, name: str, rhs: float = 0) -> None:
+        """Add expr <sense> rhs to the model under the given name"""
+        cls._insert_constraint(model, pulp.LpConstraint(expr, sense=sense, name=name, rhs=rhs))
+
+    @classmethod
+    def _compare(cls, model: pulp.LpProblem, lhs: Any, sense: int, rhs: Any, name: str) -> None:
+        """Add lhs <sense> rhs to the model under the given name
+        
+        Builds the same constraint as PuLP's comparison operators, but
+        copies the left-hand side only once instead of going through an
+        intermediate lhs - rhs expression.
+        """
+        if isinstance(lhs, Number) and not isinstance(rhs, Number):
+            lhs, rhs, sense = rhs, lhs, -sense
+        if isinstance(rhs, Number):
+            cls._add_constraint(model, lhs, sense, name, rhs)
+        else:
+            constraint = pulp.LpConstraint(lhs, sense=sense, name=name)
+            constraint.subInPlace(rhs)
+            cls._insert_constraint(model, constraint)
+
+    @classmethod
+    def _leq(cls, model: pulp.LpProblem, lhs: Any, rhs: Any, name: str) -> None:
+        """Add lhs <= rhs to the model under the given name"""
+        cls._compare(model, lhs, pulp.LpConstraintLE, rhs, name)
+
+    @classmethod
+    def _eq(cls, model: pulp.LpProblem, lhs: Any, rhs: Any, name: str) -> None:
+        """Add lhs == rhs to the model under the given name"""
+        cls._compare(model, lhs, pulp.LpConstraintEQ, rhs, name)
+
+    @classmethod
+    def _geq(cls, model: pulp.LpProblem, lhs: Any, rhs: Any, name: str) -> None:
+        """Add lhs >= rhs to the model under the given name"""
+        cls._compare(model, lhs, pulp.LpConstraintGE, rhs, name)
+
+    def _emit_rows(self, model: pulp.LpProblem, rows: List[int], cols: List[int], data: List[float],
+                   vars_by_col: List[pulp.LpVariable], senses: List[int], rhs: List[float],
+                   names: List[str]) -> None:
+        """Add one constraint per row of a coefficient matrix given in coordinate (COO) form
+        
+        Args:
+            model: PuLP model to add constraints to
+            rows: Row index of each nonzero
+            cols: Column index of each nonzero
+            data: Coefficient of each nonzero; duplicate (row, col) entries are summed
+            vars_by_col: Variable for each column index
+            senses: Constraint sense for each row
+            rhs: Right-hand side for each row
+            names: Constraint name for each row
+        """
+        row_coefs = [{} for _ in names]
+        for i, j, a in zip(rows, cols, data):
+            row_coefs[i][j] = row_coefs[i].get(j, 0) + a
+        for i, coefs in enumerate(row_coefs):
+            expr = pulp.LpAffineExpression((vars_by_col[j], a) for j, a in coefs.items())
+            self._add_constraint(model, expr, senses[i], names[i], rhs[i])
+
     @abstractmethod
     def build(self, model: pulp.LpProblem) -> None:
         """Add constraints to the optimization model
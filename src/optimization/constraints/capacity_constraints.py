@@ -17,13 +17,17 @@ class CapacityConstraints(BaseConstraint):
     def _build_processing_capacity_constraints(self, model: pulp.LpProblem) -> None:
         """Build constraints related to processing capacity"""
         if self.parameters['resource_capacity_consumption']:
+            consumption_windows = self._get_window_periods({
+                ((p, g, n, c), t2): window
+                for (p, t2, g, n, c), window in self.parameters['resource_capacity_consumption_periods'].items()
+            })
             for n, t, c, g in product(
                 self.network_sets['NODES'],
                 self.network_sets['PERIODS'],
                 self.network_sets['RESOURCE_CAPACITY_TYPES'],
                 self.network_sets['NODEGROUPS']
             ):
-                if self.parameters['node_in_nodegroup'].get((n, g), 0) == 1:
+                if (n, g) in self.node_group_pairs:
                     # Child capacity types
                     if c in self.network_sets['RESOURCE_CHILD_CAPACITY_TYPES']:
                         expr = (
@@ -35,12 +39,8 @@ class CapacityConstraints(BaseConstraint):
                             pulp.lpSum(
                                 self.variables['processed_product'][n, p, t2] * 
                                 self.parameters['resource_capacity_consumption'].get((p, t2, g, n, c), 0) 
-                                for t2, p in product(
-                                    self.network_sets['PERIODS'], 
-                                    self.network_sets['PRODUCTS']
-                                ) 
-                                if int(t2) >= int(t) - int(self.parameters['resource_capacity_consumption_periods'].get((p, t2, g, n, c), 0)) 
-                                and int(t2) < int(t)
+                                for p in self.network_sets['PRODUCTS']
+                                for t2 in consumption_windows.get(((p, g, n, c), t), ())
                             ) <= pulp.lpSum(
                                 self.variables['resource_capacity'][r, n, t, c] 
                                 for r in self.network_sets['RESOURCES']
@@ -62,13 +62,9 @@ class CapacityConstraints(BaseConstraint):
                                 self.variables['processed_product'][n, p, t2] * 
                                 self.parameters['resource_capacity_consumption'].get((p, t2, g, n, c2), 0) * 
                                 self.parameters['capacity_type_hierarchy'].get((c2, c), 0)
-                                for t2, p, c2 in product(
-                                    self.network_sets['PERIODS'],
-                                    self.network_sets['PRODUCTS'],
-                                    self.network_sets['RESOURCE_CHILD_CAPACITY_TYPES']
-                                )
-                                if int(t2) >= int(t) - int(self.parameters['resource_capacity_consumption_periods'].get((p, t2, g, n, c), 0))
-                                and int(t2) < int(t)
+                                for p in self.network_sets['PRODUCTS']
+                                for t2 in consumption_windows.get(((p, g, n, c), t), ())
+                                for c2 in self.network_sets['RESOURCE_CHILD_CAPACITY_TYPES']
                             ) <= pulp.lpSum(
                                 self.variables['resource_capacity'][r, n, t, c] 
                                 for r in self.network_sets['RESOURCES']
@@ -94,7 +90,7 @@ class CapacityConstraints(BaseConstraint):
                         self.network_sets['C_CAPACITY_EXPANSIONS'],
                         self.network_sets['PERIODS']
                     )
-                    if int(t2) <= int(t)
+                    if self.period_index[t2] <= self.period_index[t]
                 ) >= pulp.lpSum(
                     self.variables['ib_carried_over_demand'][n_r, p, t] *
                     self.parameters['products_measures'].get((p, u), 0)
@@ -119,7 +115,7 @@ class CapacityConstraints(BaseConstraint):
                         self.network_sets['C_CAPACITY_EXPANSIONS'],
                         self.network_sets['PERIODS']
                     )
-                    if int(t2) <= int(t)
+                    if self.period_index[t2] <= self.period_index[t]
                 ) >= pulp.lpSum(
                     self.variables['ob_carried_over_demand'][n_d, p, t] *
                     self.parameters['products_measures'].get((p, u), 0)
@@ -151,7 +147,7 @@ class CapacityConstraints(BaseConstraint):
             self.network_sets['NODES'],
             self.network_sets['NODEGROUPS']
         ):
-            if self.parameters['node_in_nodegroup'].get((n,g),0) == 1:
+            if (n, g) in self.node_group_pairs:
                 if (self.parameters['processing_assembly_p1_required'].get((n,g,p1,p2)) is not None and 
                     self.parameters['processing_assembly_p2_required'].get((n,g,p1,p2)) is not None):
                     expr = (
@@ -174,7 +170,7 @@ class CapacityConstraints(BaseConstraint):
         # Maximum dropped demand constraints
         for n_index in nodes:
             for g_index in self.network_sets['NODEGROUPS']:
-                if n_index == '@' or self.parameters['node_in_nodegroup'].get((n_index, g_index), 0) == 1:
+                if n_index == '@' or (n_index, g_index) in self.node_group_pairs:
                     nodes_list = self.network_sets['NODES'] if n_index == '@' else [n_index]
                     
                     for t_index in periods:
@@ -199,7 +195,7 @@ class CapacityConstraints(BaseConstraint):
         # Maximum inbound carried demand constraints
         for n_index in receiving_nodes:
             for g_index in self.network_sets['NODEGROUPS']:
-                if n_index == '@' or self.parameters['node_in_nodegroup'].get((n_index, g_index), 0) == 1:
+                if n_index == '@' or (n_index, g_index) in self.node_group_pairs:
                     nodes_list = self.network_sets['RECEIVING_NODES'] if n_index == '@' else [n_index]
                     
                     for t_index in periods:
@@ -224,7 +220,7 @@ class CapacityConstraints(BaseConstraint):
         # Maximum outbound carried demand constraints
         for n_index in departing_nodes:
             for g_index in self.network_sets['NODEGROUPS']:
-                if n_index == '@' or self.parameters['node_in_nodegroup'].get((n_index, g_index), 0) == 1:
+                if n_index == '@' or (n_index, g_index) in self.node_group_pairs:
                     nodes_list = self.network_sets['DEPARTING_NODES'] if n_index == '@' else [n_index]
                     
                     for t_index in periods:
@@ -248,23 +244,39 @@ class CapacityConstraints(BaseConstraint):
 
     def _build_capacity_option_cost_constraints(self, model: pulp.LpProblem) -> None:
         """Build constraints for capacity option costs"""
+        use_option = self.variables['use_carrying_capacity_option']
+        nodes = set(self.network_sets['NODES'])
+        expansions = set(self.network_sets['C_CAPACITY_EXPANSIONS'])
+
+        # Period-weighted expansion cost term of every option use, skipping zero costs
+        option_terms = {}
+        for (t, n, e_c), cost in self.parameters['carrying_expansions'].items():
+            if t in self.period_weight and n in nodes and e_c in expansions:
+                coef = self.period_weight[t] * cost
+                if coef != 0:
+                    option_terms[n, e_c, t] = (use_option[n,e_c,t], coef)
+
+        def option_cost_terms(keys):
+            return pulp.LpAffineExpression(
+                [option_terms[key] for key in keys if key in option_terms]
+            )
+
         # Capacity option costs by period and node
         for t, n, e_c in product(
             self.network_sets['PERIODS'],
             self.network_sets['NODES'],
             self.network_sets['C_CAPACITY_EXPANSIONS']
         ):
+            coef = (
+                option_terms[n, e_c, t][1] if (n, e_c, t) in option_terms else 0
+            ) + sum(
+                self.parameters['carrying_expansions_persisting_cost'].get((t2, n, e_c), 0) 
+                for t2 in self.network_sets['PERIODS'] 
+                if self.period_index[t2] >= self.period_index[t]
+            )
             expr = (
                 self.variables['c_capacity_option_cost'][t, n, e_c] ==
-                self.parameters['period_weight'].get(int(t), 1) * 
-                self.variables['use_carrying_capacity_option'][n,e_c,t] * 
-                self.parameters['carrying_expansions'].get((t, n, e_c), 0) +
-                self.variables['use_carrying_capacity_option'][n,e_c,t] * 
-                pulp.lpSum(
-                    self.parameters['carrying_expansions_persisting_cost'].get((t2, n, e_c), 0) 
-                    for t2 in self.network_sets['PERIODS'] 
-                    if int(t2) >= int(t)
-                )
+                pulp.LpAffineExpression([(use_option[n,e_c,t], coef)] if coef != 0 else [])
             )
             model += (expr, f"CarryingCapacityOptionCost_{t}_{n}_{e_c}")
 
@@ -275,12 +287,7 @@ class CapacityConstraints(BaseConstraint):
         ):
             expr = (
                 self.variables['c_capacity_option_cost_by_location_type'][n, e_c] ==
-                pulp.lpSum(
-                    self.parameters['period_weight'].get(int(t), 1) * 
-                    self.variables['use_carrying_capacity_option'][n,e_c,t] * 
-                    self.parameters['carrying_expansions'].get((t, n, e_c), 0) 
-                    for t in self.network_sets['PERIODS']
-                )
+                option_cost_terms((n, e_c, t) for t in self.network_sets['PERIODS'])
             )
             model += (expr, f"CarryingCapacityOptionCostByLocationType_{n}_{e_c}")
 
@@ -291,12 +298,7 @@ class CapacityConstraints(BaseConstraint):
         ):
             expr = (
                 self.variables['c_capacity_option_cost_by_period_type'][e_c, t] ==
-                self.parameters['period_weight'].get(int(t), 1) * 
-                pulp.lpSum(
-                    self.variables['use_carrying_capacity_option'][n,e_c,t] * 
-                    self.parameters['carrying_expansions'].get((t, n, e_c), 0) 
-                    for n in self.network_sets['NODES']
-                )
+                option_cost_terms((n, e_c, t) for n in self.network_sets['NODES'])
             )
             model += (expr, f"CarryingCapacityOptionCostByPeriodType_{e_c}_{t}")
 
@@ -304,11 +306,8 @@ class CapacityConstraints(BaseConstraint):
         for n in self.network_sets['NODES']:
             expr = (
                 self.variables['c_capacity_option_cost_by_location'][n] ==
-                pulp.lpSum(
-                    self.parameters['period_weight'].get(int(t), 1) * 
-                    self.variables['use_carrying_capacity_option'][n,e_c,t] * 
-                    self.parameters['carrying_expansions'].get((t, n, e_c), 0) 
-                    for t, e_c in product(
+                option_cost_terms(
+                    (n, e_c, t) for t, e_c in product(
                         self.network_sets['PERIODS'],
                         self.network_sets['C_CAPACITY_EXPANSIONS']
                     )
@@ -320,11 +319,8 @@ class CapacityConstraints(BaseConstraint):
         for t in self.network_sets['PERIODS']:
             expr = (
                 self.variables['c_capacity_option_cost_by_period'][t] ==
-                self.parameters['period_weight'].get(int(t), 1) * 
-                pulp.lpSum(
-                    self.variables['use_carrying_capacity_option'][n,e_c,t] * 
-                    self.parameters['carrying_expansions'].get((t, n, e_c), 0) 
-                    for n, e_c in product(
+                option_cost_terms(
+                    (n, e_c, t) for n, e_c in product(
                         self.network_sets['NODES'],
                         self.network_sets['C_CAPACITY_EXPANSIONS']
                     )
@@ -336,11 +332,8 @@ class CapacityConstraints(BaseConstraint):
         for e_c in self.network_sets['C_CAPACITY_EXPANSIONS']:
             expr = (
                 self.variables['c_capacity_option_cost_by_type'][e_c] ==
-                pulp.lpSum(
-                    self.parameters['period_weight'].get(int(t), 1) * 
-                    self.variables['use_carrying_capacity_option'][n,e_c,t] * 
-                    self.parameters['carrying_expansions'].get((t, n, e_c), 0) 
-                    for n, t in product(
+                option_cost_terms(
+                    (n, e_c, t) for n, t in product(
                         self.network_sets['NODES'],
                         self.network_sets['PERIODS']
                     )
@@ -351,11 +344,8 @@ class CapacityConstraints(BaseConstraint):
         # Grand total capacity option cost
         expr = (
             self.variables['grand_total_c_capacity_option'] ==
-            pulp.lpSum(
-                self.parameters['period_weight'].get(int(t), 1) * 
-                self.variables['use_carrying_capacity_option'][n,e_c,t] * 
-                self.parameters['carrying_expansions'].get((t, n, e_c), 0) 
-                for n, t, e_c in product(
+            option_cost_terms(
+                (n, e_c, t) for n, t, e_c in product(
                     self.network_sets['NODES'],
                     self.network_sets['PERIODS'],
                     self.network_sets['C_CAPACITY_EXPANSIONS']
@@ -363,131 +353,3 @@ class CapacityConstraints(BaseConstraint):
             )
         )
         model += (expr, "GrandTotalCarryingCapacityOption")
-
-    def _build_processing_capacity_constraints(self, model: pulp.LpProblem) -> None:
-        """Build constraints related to processing capacity"""
-        if self.parameters['resource_capacity_consumption']:
-            for n, t, c, g in product(
-                self.network_sets['NODES'],
-                self.network_sets['PERIODS'],
-                self.network_sets['RESOURCE_CAPACITY_TYPES'],
-                self.network_sets['NODEGROUPS']
-            ):
-                if self.parameters['node_in_nodegroup'].get((n, g), 0) == 1:
-                    # Child capacity types
-                    if c in self.network_sets['RESOURCE_CHILD_CAPACITY_TYPES']:
-                        expr = (
-                            pulp.lpSum(
-                                self.variables['processed_product'][n, p, t] * 
-                                self.parameters['resource_capacity_consumption'].get((p, t, g, n, c), 0) 
-                                for p in self.network_sets['PRODUCTS']
-                            ) +
-                            pulp.lpSum(
-                                self.variables['processed_product'][n, p, t2] * 
-                                self.parameters['resource_capacity_consumption'].get((p, t2, g, n, c), 0) 
-                                for t2, p in product(
-                                    self.network_sets['PERIODS'], 
-                                    self.network_sets['PRODUCTS']
-                                ) 
-                                if int(t2) >= int(t) - int(self.parameters['resource_capacity_consumption_periods'].get((p, t2, g, n, c), 0)) 
-                                and int(t2) < int(t)
-                            ) <= pulp.lpSum(
-                                self.variables['resource_capacity'][r, n, t, c] 
-                                for r in self.network_sets['RESOURCES']
-                            )
-                        )
-                        model += (expr, f"Capacity_Constraint_{n}_{t}_{c}_{g}")
-
-                    # Parent capacity types
-                    if c in self.network_sets['RESOURCE_PARENT_CAPACITY_TYPES']:
-                        expr = (
-                            pulp.lpSum(
-                                self.variables['processed_product'][n, p, t] * 
-                                self.parameters['resource_capacity_consumption'].get((p, t, g, n, c2), 0) * 
-                                self.parameters['capacity_type_hierarchy'].get((c2, c), 0)
-                                for p in self.network_sets['PRODUCTS']
-                                for c2 in self.network_sets['RESOURCE_CHILD_CAPACITY_TYPES']
-                            ) +
-                            pulp.lpSum(
-                                self.variables['processed_product'][n, p, t2] * 
-                                self.parameters['resource_capacity_consumption'].get((p, t2, g, n, c2), 0) * 
-                                self.parameters['capacity_type_hierarchy'].get((c2, c), 0)
-                                for t2, p, c2 in product(
-                                    self.network_sets['PERIODS'],
-                                    self.network_sets['PRODUCTS'],
-                                    self.network_sets['RESOURCE_CHILD_CAPACITY_TYPES']
-                                )
-                                if int(t2) >= int(t) - int(self.parameters['resource_capacity_consumption_periods'].get((p, t2, g, n, c), 0))
-                                and int(t2) < int(t)
-                            ) <= pulp.lpSum(
-                                self.variables['resource_capacity'][r, n, t, c] 
-                                for r in self.network_sets['RESOURCES']
-                            )
-                        )
-                        model += (expr, f"Parent_Capacity_Constraint_{n}_{t}_{c}_{g}")
-
-    def _build_carrying_capacity_constraints(self, model: pulp.LpProblem) -> None:
-        """Build constraints related to carrying capacity"""
-        # Inbound carrying capacity constraints
-        for t, n_r, u, g in product(
-            self.network_sets['PERIODS'],
-            self.network_sets['RECEIVING_NODES'],
-            self.network_sets['MEASURES'],
-            self.network_sets['NODEGROUPS']
-        ):
-            expr = (
-                self.parameters['ib_carrying_capacity'].get((t, n_r, u, g), self.big_m) +
-                pulp.lpSum(
-                    self.variables['use_carrying_capacity_option'][n_r, e_c, t2] *
-                    self.parameters['ib_carrying_expansion_capacity'].get((t2, n_r, e_c), 0)
-                    for e_c, t2 in product(
-                        self.network_sets['C_CAPACITY_EXPANSIONS'],
-                        self.network_sets['PERIODS']
-                    )
-                    if int(t2) <= int(t)
-                ) >= pulp.lpSum(
-                    self.variables['ib_carried_over_demand'][n_r, p, t] *
-                    self.parameters['products_measures'].get((p, u), 0)
-                    for p in self.network_sets['PRODUCTS']
-                )
-            )
-            model += (expr, f"IB_CarryingCapacity_{t}_{n_r}_{u}_{g}")
-
-        # Outbound carrying capacity constraints
-        for t, n_d, u, g in product(
-            self.network_sets['PERIODS'],
-            self.network_sets['DEPARTING_NODES'],
-            self.network_sets['MEASURES'],
-            self.network_sets['NODEGROUPS']
-        ):
-            expr = (
-                self.parameters['ob_carrying_capacity'].get((t, n_d, u, g), self.big_m) +
-                pulp.lpSum(
-                    self.variables['use_carrying_capacity_option'][n_d, e_c, t2] *
-                    self.parameters['ob_carrying_expansion_capacity'].get((t2, n_d, e_c), 0)
-                    for e_c, t2 in product(
-                        self.network_sets['C_CAPACITY_EXPANSIONS'],
-                        self.network_sets['PERIODS']
-                    )
-                    if int(t2) <= int(t)
-                ) >= pulp.lpSum(
-                    self.variables['ob_carried_over_demand'][n_d, p, t] *
-                    self.parameters['products_measures'].get((p, u), 0)
-                    for p in self.network_sets['PRODUCTS']
-                )
-            )
-            model += (expr, f"OB_CarryingCapacity_{t}_{n_d}_{u}_{g}")
-
-    def _build_max_utilization_constraints(self, model: pulp.LpProblem) -> None:
-        """Build constraints tracking maximum utilization"""
-        for n, t, c in product(
-            self.network_sets['NODES'],
-            self.network_sets['PERIODS'],
-            self.network_sets['RESOURCE_CAPACITY_TYPES']
-        ):
-            # Calculate current utilization
-            expr = (
-                self.variables['max_capacity_utilization'] >= 
-                self.variables['node_utilization'][n, t, c]
-            )
-            model += (expr, f"max_capacity_utilization_constraint_{n}_{t}_{c}")
\ No newline at end of file
@@ -23,7 +23,7 @@ class CostConstraints(BaseConstraint):
             self.network_sets['RESOURCE_COST_TYPES'],
             self.network_sets['NODEGROUPS']
         ):
-            if self.parameters['node_in_nodegroup'].get((n, g), 0) == 1:
+            if (n, g) in self.node_group_pairs:
                 expr = (
                     pulp.lpSum(
                         self.variables['processed_product'][n, p, t] *
@@ -57,7 +57,7 @@ class CostConstraints(BaseConstraint):
             self.network_sets['AGES']
         ):
             expr = (self.variables['ib_carried_volume_cost'][n, p, t, a] >= 
-                   self.parameters['period_weight'].get(int(t), 1) * 
+                   self.period_weight[t] * 
                    self.variables['ib_vol_carried_over_by_age'][n, p, t, a] * 
                    self.parameters['ib_carrying_cost'].get((t, p, n, g), 0))
             model += (expr, f"ib_carried_volume_cost_{n}_{p}_{t}_{g}_{a}")
@@ -71,7 +71,7 @@ class CostConstraints(BaseConstraint):
             self.network_sets['AGES']
         ):
             expr = (self.variables['ob_carried_volume_cost'][n, p, t, a] >= 
-                   self.parameters['period_weight'].get(int(t), 1) * 
+                   self.period_weight[t] * 
                    self.variables['ob_vol_carried_over_by_age'][n, p, t, a] * 
                    self.parameters['ob_carrying_cost'].get((t, p, n, g), 0))
             model += (expr, f"ob_carried_volume_cost_{n}_{p}_{t}_{g}_{a}")
@@ -85,7 +85,7 @@ class CostConstraints(BaseConstraint):
             self.network_sets['AGES']
         ):
             expr = (self.variables['dropped_volume_cost'][n, p, t, a] >= 
-                   self.parameters['period_weight'].get(int(t), 1) * 
+                   self.period_weight[t] * 
                    self.variables['vol_dropped_by_age'][n, p, t, a] * 
                    self.parameters['dropping_cost'].get((t, p, n, g), 0))
             model += (expr, f"dropped_volume_cost_{n}_{p}_{t}_{g}_{a}")
@@ -117,9 +117,9 @@ class CostConstraints(BaseConstraint):
             self.network_sets['PERIODS'],
             self.network_sets['NODEGROUPS']
         ):
-            if self.parameters['node_in_nodegroup'].get((o, g), 0) == 1:
+            if (o, g) in self.node_group_pairs:
                 expr = (self.variables['variable_operating_costs'][o, p, t] == 
-                       self.parameters['period_weight'].get(int(t), 1) * 
+                       self.period_weight[t] * 
                        self.parameters['operating_costs_variable'].get((t, o, p, g), 0) * 
                        self.variables['processed_product'][o, p, t])
                 model += (expr, f"variable_operating_costs_{o}_{p}_{t}_{g}")
@@ -141,7 +141,7 @@ class CostConstraints(BaseConstraint):
             self.network_sets['NODEGROUPS']
         ):
             expr = (self.variables['fixed_operating_costs'][o, t] == 
-                   self.parameters['period_weight'].get(int(t), 1) * 
+                   self.period_weight[t] * 
                    self.parameters['operating_costs_fixed'].get((t, o, g), 0) * 
                    self.variables['is_site_operating'][o, t])
             model += (expr, f"fixed_operating_costs_{o}_{t}_{g}")
@@ -669,8 +669,8 @@ class CostConstraints(BaseConstraint):
                 self.network_sets['NODEGROUPS']
             ):
                 if int(t) > 1:
-                    if (self.parameters['node_in_nodegroup'].get((o, g), 0) == 1 and 
-                        self.parameters['node_in_nodegroup'].get((d, g2), 0) == 1):
+                    if ((o, g) in self.node_group_pairs and 
+                        (d, g2) in self.node_group_pairs):
                         # POP cost constraint
                         expr = (self.variables['pop_cost'][str(int(t)-1), t, p, o, d] == 
                                self.parameters['pop_cost_per_volume_moved'].get((str(int(t)-1), t, p, o, d, g, g2), 0) * 
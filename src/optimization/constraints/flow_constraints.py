@@ -20,261 +20,289 @@ class FlowConstraints(BaseConstraint):
 
     def _build_node_type_constraints(self, model: pulp.LpProblem) -> None:
         """Build constraints for valid flows between node types"""
+        origins = set(self.network_sets['ORIGINS'])
+        destinations = set(self.network_sets['DESTINATIONS'])
+        intermediates = set(self.network_sets['INTERMEDIATES'])
+        send_to_destinations = set(self.network_sets['SEND_TO_DESTINATIONS_NODES'])
+        send_to_intermediates = set(self.network_sets['SEND_TO_INTERMEDIATES_NODES'])
+        receive_from_origins = set(self.network_sets['RECEIVE_FROM_ORIGIN_NODES'])
+        receive_from_intermediates = set(self.network_sets['RECEIVE_FROM_INTERMEDIATES_NODES'])
+        departed = self.variables['departed_product']
         for n, n2, p, t in product(
-            self.network_sets['DEPARTING_NODES'],
-            self.network_sets['RECEIVING_NODES'],
-            self.network_sets['PRODUCTS'],
-            self.network_sets['PERIODS']
+            tuple(self.network_sets['DEPARTING_NODES']),
+            tuple(self.network_sets['RECEIVING_NODES']),
+            tuple(self.network_sets['PRODUCTS']),
+            tuple(self.network_sets['PERIODS'])
         ):
             max_value = 0
             if n == n2:
                 max_value += self.big_m
-            if (n in self.network_sets['ORIGINS'] and 
-                n in self.network_sets['SEND_TO_DESTINATIONS_NODES'] and 
-                n2 in self.network_sets['DESTINATIONS'] and 
-                n2 in self.network_sets['RECEIVE_FROM_ORIGIN_NODES']):
+            if (n in origins and 
+                n in send_to_destinations and 
+                n2 in destinations and 
+                n2 in receive_from_origins):
                 max_value += self.big_m
-            if (n in self.network_sets['ORIGINS'] and 
-                n in self.network_sets['SEND_TO_INTERMEDIATES_NODES'] and 
-                n2 in self.network_sets['INTERMEDIATES'] and 
-                n2 in self.network_sets['RECEIVE_FROM_ORIGIN_NODES']):
+            if (n in origins and 
+                n in send_to_intermediates and 
+                n2 in intermediates and 
+                n2 in receive_from_origins):
                 max_value += self.big_m
-            if (n in self.network_sets['INTERMEDIATES'] and 
-                n in self.network_sets['SEND_TO_DESTINATIONS_NODES'] and 
-                n2 in self.network_sets['DESTINATIONS'] and 
-                n2 in self.network_sets['RECEIVE_FROM_INTERMEDIATES_NODES']):
+            if (n in intermediates and 
+                n in send_to_destinations and 
+                n2 in destinations and 
+                n2 in receive_from_intermediates):
                 max_value += self.big_m
-            if (n in self.network_sets['INTERMEDIATES'] and 
-                n in self.network_sets['SEND_TO_INTERMEDIATES_NODES'] and 
-                n2 in self.network_sets['INTERMEDIATES'] and 
-                n2 in self.network_sets['RECEIVE_FROM_INTERMEDIATES_NODES']):
+            if (n in intermediates and 
+                n in send_to_intermediates and 
+                n2 in intermediates and 
+                n2 in receive_from_intermediates):
                 max_value += self.big_m
             
-            expr = (self.variables['departed_product'][n,n2,p,t] <= max_value)
-            model += (expr, f"node_type_constraints_{n}_{n2}_{p}_{t}")
+            self._leq(model, departed[n,n2,p,t], max_value, f"node_type_constraints_{n}_{n2}_{p}_{t}")
     
     def _build_demand_completion_constraints(self, model: pulp.LpProblem) -> None:
         """Build constraints for demand completion"""
+        receiving_nodes = tuple(self.network_sets['RECEIVING_NODES'])
+        periods = tuple(self.network_sets['PERIODS'])
+        products = tuple(self.network_sets['PRODUCTS'])
+        demand = self.parameters['demand']
+        completed = self.variables['arrived_and_completed_product']
+
         # Individual node demand completion
-        for n_r, t, p in product(
-            self.network_sets['RECEIVING_NODES'],
-            self.network_sets['PERIODS'],
-            self.network_sets['PRODUCTS']
-        ):
-            expr1 = (
-                self.variables['arrived_and_completed_product'][t, p, n_r] == 
-                self.parameters['demand'].get((t, p, n_r), 0)
+        for n_r, t, p in product(receiving_nodes, periods, products):
+            self._eq(
+                model, completed[t, p, n_r], demand.get((t, p, n_r), 0),
+                f"arrived_and_completed_product_equals_demand_{n_r}_{t}_{p}"
             )
-            model += (expr1, f"arrived_and_completed_product_equals_demand_{n_r}_{t}_{p}")
-            
-            expr2 = (
-                self.variables['arrived_and_completed_product'][t, p, n_r] >= 
-                self.parameters['demand'].get((t, p, n_r), 0)
+            self._geq(
+                model, completed[t, p, n_r], demand.get((t, p, n_r), 0),
+                f"arrived_and_completed_product_at_least_demand_{n_r}_{t}_{p}"
             )
-            model += (expr2, f"arrived_and_completed_product_at_least_demand_{n_r}_{t}_{p}")
 
         # Total demand completion
-        expr = (
-            pulp.lpSum(
-                self.variables['arrived_and_completed_product'][t, p, n_r] 
-                for t in self.network_sets['PERIODS'] 
-                for p in self.network_sets['PRODUCTS'] 
-                for n_r in self.network_sets['RECEIVING_NODES']
-            ) == self.variables['total_arrived_and_completed_product']
+        expr = pulp.LpAffineExpression(
+            (completed[t, p, n_r], 1)
+            for t in periods
+            for p in products
+            for n_r in receiving_nodes
         )
-        model += (expr, f"total_arrived_and_completed_product_equals_demand")
+        expr.subInPlace(self.variables['total_arrived_and_completed_product'])
+        self._eq(model, expr, 0, "total_arrived_and_completed_product_equals_demand")
 
     def _build_flow_limit_constraints(self, model: pulp.LpProblem) -> None:
         """Build constraints for flow limits"""
+        node_group_pairs = self.node_group_pairs
+        big_m = self.big_m
+        all_departing_nodes = tuple(self.network_sets['DEPARTING_NODES'])
+        all_receiving_nodes = tuple(self.network_sets['RECEIVING_NODES'])
+        all_periods = tuple(self.network_sets['PERIODS'])
+        all_modes = tuple(self.network_sets['MODES'])
+        all_products = tuple(self.network_sets['PRODUCTS'])
+        expansions = tuple(self.network_sets['T_CAPACITY_EXPANSIONS'])
+        num_loads = self.variables['num_loads']
+        use_option = self.variables['use_transportation_capacity_option']
+        departed_measures = self.variables['departed_measures']
+        departed_by_mode = self.variables['departed_product_by_mode']
+        assigned = self.variables['is_destination_assigned_to_origin']
+        is_launched = self.variables['is_launched']
+        products_measures = self.parameters['products_measures']
+        expansion_capacity = self.parameters['transportation_expansion_capacity']
+        transportation_min = self.parameters['transportation_constraints_min']
+        transportation_max = self.parameters['transportation_constraints_max']
+        flow_min = self.parameters['flow_constraints_min']
+        flow_max = self.parameters['flow_constraints_max']
+        flow_min_pct_ib = self.parameters['flow_constraints_min_pct_ib']
+        flow_max_pct_ib = self.parameters['flow_constraints_max_pct_ib']
+        flow_min_connections = self.parameters['flow_constraints_min_connections']
+        flow_max_connections = self.parameters['flow_constraints_max_connections']
+
         # Add '@' to the sets for aggregation
-        periods = list(self.network_sets['PERIODS']) + ['@']
-        departing_nodes = list(self.network_sets['DEPARTING_NODES']) + ['@']
-        receiving_nodes = list(self.network_sets['RECEIVING_NODES']) + ['@']
-        modes = list(self.network_sets['MODES']) + ['@']
+        periods = list(all_periods) + ['@']
+        departing_nodes = list(all_departing_nodes) + ['@']
+        receiving_nodes = list(all_receiving_nodes) + ['@']
+        modes = list(all_modes) + ['@']
         measures = list(self.network_sets['MEASURES'])
-        products = list(self.network_sets['PRODUCTS']) + ['@']
+        products = list(all_products) + ['@']
         nodegroups = list(self.network_sets['NODEGROUPS']) + ['@']
 
-        if (self.parameters.get('flow_constraints_max') or 
-            self.parameters.get('flow_constraints_min')):
+        # Departed volume of every (o, d, t, m, u, p) index, built once and
+        # shared by the units and inbound percentage rows of all group pairs.
+        # The minimum units rows count a product without the measure at big_m,
+        # every other row at 0.
+        departed_volume = {}
+
+        def departed_volume_exprs(o_index, d_index, t_index, m_index, u_index, p_index):
+            key = (o_index, d_index, t_index, m_index, u_index, p_index)
+            if key not in departed_volume:
+                lanes = list(product(
+                    all_departing_nodes if o_index == '@' else (o_index,),
+                    all_receiving_nodes if d_index == '@' else (d_index,),
+                    all_periods if t_index == '@' else (t_index,),
+                    all_modes if m_index == '@' else (m_index,)
+                ))
+                terms, min_terms = [], []
+                for p in (all_products if p_index == '@' else (p_index,)):
+                    coef = products_measures.get((p, u_index), 0)
+                    min_coef = products_measures.get((p, u_index), big_m)
+                    if coef != 0:
+                        terms.extend((departed_by_mode[o,d,p,t,m], coef) for o, d, t, m in lanes)
+                    if min_coef != 0:
+                        min_terms.extend((departed_by_mode[o,d,p,t,m], min_coef) for o, d, t, m in lanes)
+                departed_volume[key] = (
+                    pulp.LpAffineExpression(terms), pulp.LpAffineExpression(min_terms)
+                )
+            return departed_volume[key]
+
+        if flow_max or flow_min:
             
             for o_index in departing_nodes:
                 for g_index in nodegroups:
                     if (o_index == '@' or 
-                        self.parameters['node_in_nodegroup'].get((o_index, g_index), 0) == 1):
+                        (o_index, g_index) in node_group_pairs):
                         
                         departing_nodes_list = (
-                            self.network_sets['DEPARTING_NODES'] 
+                            all_departing_nodes 
                             if o_index == '@' else [o_index]
                         )
                         
                         for d_index in receiving_nodes:
                             for g2_index in nodegroups:
                                 if (d_index == '@' or 
-                                    self.parameters['node_in_nodegroup'].get((d_index, g2_index), 0) == 1):
+                                    (d_index, g2_index) in node_group_pairs):
                                     
                                     receiving_nodes_list = (
-                                        self.network_sets['RECEIVING_NODES'] 
+                                        all_receiving_nodes 
                                         if d_index == '@' else [d_index]
                                     )
                                     
                                     for t_index in periods:
                                         periods_list = (
-                                            self.network_sets['PERIODS'] 
+                                            all_periods 
                                             if t_index == '@' else [t_index]
                                         )
+
+                                        # Rows on a single lane and period only bind while both ends are launched
+                                        launch_slack = 0
+                                        if t_index != '@':
+                                            for n in (o_index, d_index):
+                                                if n != '@':
+                                                    launch_slack = launch_slack + big_m * (1 - is_launched[n, t_index])
                                         
                                         for m_index in modes:
                                             modes_list = (
-                                                self.network_sets['MODES'] 
+                                                all_modes 
                                                 if m_index == '@' else [m_index]
                                             )
+                                            lanes = list(product(
+                                                departing_nodes_list, receiving_nodes_list, periods_list
+                                            ))
                                             
                                             # Minimum load constraints
-                                            min_left_expr = self.parameters['transportation_constraints_min'].get(
+                                            min_left_expr = transportation_min.get(
                                                 (t_index, o_index, d_index, m_index, 'load', 'count', g_index, g2_index), 0
                                             )
-                                            min_right_expr = pulp.lpSum(
-                                                self.variables['num_loads'][o,d,t,m]
-                                                for o in departing_nodes_list
-                                                for d in receiving_nodes_list
-                                                for t in periods_list
+                                            min_right_expr = pulp.LpAffineExpression(
+                                                (num_loads[o,d,t,m], 1)
+                                                for o, d, t in lanes
                                                 for m in modes_list
                                             )
-                                            model += (
-                                                min_left_expr <= min_right_expr,
+                                            self._leq(
+                                                model, min_left_expr, min_right_expr,
                                                 f"load_constraints_min_{t_index}_{o_index}_{d_index}_{m_index}_{g_index}_{g2_index}"
                                             )
                                             
-                                            # Maximum load constraints with capacity expansion
-                                            max_left_expr = (
-                                                self.parameters['transportation_constraints_max'].get(
+                                            # Maximum load constraints with capacity expansion. The
+                                            # expansion does not vary by mode or product, so its term
+                                            # counts once for each of them.
+                                            repeat = len(modes_list) * len(all_products)
+                                            load_capacities = []
+                                            for e in expansions:
+                                                capacity = expansion_capacity.get((e, m_index, 'load', 'count'), 0) * repeat
+                                                if capacity != 0:
+                                                    load_capacities.append((e, capacity))
+                                            max_left_expr = pulp.LpAffineExpression(
+                                                [
+                                                    (use_option[o,d,e,t], capacity)
+                                                    for o, d, t in lanes
+                                                    for e, capacity in load_capacities
+                                                ],
+                                                constant=transportation_max.get(
                                                     (t_index, o_index, d_index, m_index, 'load', 'count', g_index, g2_index),
-                                                    self.big_m
-                                                ) + 
-                                                pulp.lpSum(
-                                                    self.variables['use_transportation_capacity_option'][o,d,e,t] * 
-                                                    self.parameters['transportation_expansion_capacity'].get(
-                                                        (e, m_index, 'load', 'count'), 0
-                                                    )
-                                                    for o in (self.network_sets['DEPARTING_NODES'] if o_index=='@' else [o_index])
-                                                    for d in (self.network_sets['RECEIVING_NODES'] if d_index=='@' else [d_index])
-                                                    for t in (self.network_sets['PERIODS'] if t_index=='@' else [t_index])
-                                                    for m in (self.network_sets['MODES'] if m_index=='@' else [m_index])
-                                                    for p in self.network_sets['PRODUCTS']
-                                                    for e in self.network_sets['T_CAPACITY_EXPANSIONS']
+                                                    big_m
                                                 )
                                             )
-                                            model += (
-                                                max_left_expr >= min_right_expr,
+                                            self._geq(
+                                                model, max_left_expr, min_right_expr,
                                                 f"load_constraints_max_{t_index}_{o_index}_{d_index}_{m_index}_{g_index}_{g2_index}"
                                             )
 
                                             # Add measure-specific constraints
                                             for u_index in measures:
                                                 measures_list = (
-                                                    self.network_sets['MEASURES'] 
+                                                    measures 
                                                     if u_index == '@' else [u_index]
                                                 )
                                                 
-                                                if (self.parameters.get('transportation_constraints_min') or 
-                                                    self.parameters.get('transportation_constraints_max')):
+                                                if transportation_min or transportation_max:
                                                     
                                                     # Minimum transportation constraints
-                                                    min_trans_left_expr = (
-                                                        self.parameters['transportation_constraints_min'].get(
-                                                            (t_index, o_index, d_index, m_index, 'unit', u_index, g_index, g2_index), 0
-                                                        )
+                                                    min_trans_left_expr = transportation_min.get(
+                                                        (t_index, o_index, d_index, m_index, 'unit', u_index, g_index, g2_index), 0
                                                     )
-                                                    min_trans_right_expr = pulp.lpSum(
-                                                        self.variables['departed_measures'][o,d,p,t,m,u]
-                                                        for o in departing_nodes_list
-                                                        for d in receiving_nodes_list
-                                                        for t in periods_list
+                                                    min_trans_right_expr = pulp.LpAffineExpression(
+                                                        (departed_measures[o,d,p,t,m,u], 1)
+                                                        for o, d, t in lanes
                                                         for m in modes_list
-                                                        for p in self.network_sets['PRODUCTS']
+                                                        for p in all_products
                                                         for u in measures_list
                                                     )
-                                                    model += (
-                                                        min_trans_left_expr <= min_trans_right_expr,
+                                                    self._leq(
+                                                        model, min_trans_left_expr, min_trans_right_expr,
                                                         f"transportation_constraints_min_{t_index}_{o_index}_{d_index}_{m_index}_{u_index}_{g_index}_{g2_index}"
                                                     )
                                                     
                                                     # Maximum transportation constraints with capacity expansion
-                                                    max_trans_left_expr = (
-                                                        self.parameters['transportation_constraints_max'].get(
+                                                    unit_repeat = repeat * len(measures_list)
+                                                    unit_capacities = []
+                                                    for e in expansions:
+                                                        capacity = expansion_capacity.get((e, m_index, 'unit', u_index), 0) * unit_repeat
+                                                        if capacity != 0:
+                                                            unit_capacities.append((e, capacity))
+                                                    max_trans_left_expr = pulp.LpAffineExpression(
+                                                        [
+                                                            (use_option[o,d,e,t], capacity)
+                                                            for o, d, t in lanes
+                                                            for e, capacity in unit_capacities
+                                                        ],
+                                                        constant=transportation_max.get(
                                                             (t_index, o_index, d_index, m_index, 'unit', u_index, g_index, g2_index),
-                                                            self.big_m
-                                                        ) +
-                                                        pulp.lpSum(
-                                                            self.variables['use_transportation_capacity_option'][o,d,e,t] * 
-                                                            self.parameters['transportation_expansion_capacity'].get(
-                                                                (e, m_index, 'unit', u_index), 0
-                                                            )
-                                                            for o in (self.network_sets['DEPARTING_NODES'] if o_index=='@' else [o_index])
-                                                            for d in (self.network_sets['RECEIVING_NODES'] if d_index=='@' else [d_index])
-                                                            for t in (self.network_sets['PERIODS'] if t_index=='@' else [t_index])
-                                                            for m in (self.network_sets['MODES'] if m_index=='@' else [m_index])
-                                                            for p in self.network_sets['PRODUCTS']
-                                                            for u in (self.network_sets['MEASURES'] if u_index=='@' else [u_index])
-                                                            for e in self.network_sets['T_CAPACITY_EXPANSIONS']
+                                                            big_m
                                                         )
                                                     )
-                                                    model += (
-                                                        max_trans_left_expr >= min_trans_right_expr,
+                                                    self._geq(
+                                                        model, max_trans_left_expr, min_trans_right_expr,
                                                         f"transportation_constraints_max_{t_index}_{o_index}_{d_index}_{m_index}_{u_index}_{g_index}_{g2_index}"
                                                     )
 
                                                 # Add product-specific flow constraints
                                                 for p_index in products:
-                                                    if self.parameters['products_measures'].get((p_index, u_index), 'NA') != 'NA':
-                                                        products_list = (
-                                                            self.network_sets['PRODUCTS'] 
-                                                            if p_index == '@' else [p_index]
+                                                    if products_measures.get((p_index, u_index), 'NA') != 'NA':
+                                                        flow_key = (o_index, d_index, p_index, t_index, m_index, 'unit', u_index, g_index, g2_index)
+                                                        volume_expr, min_volume_expr = departed_volume_exprs(
+                                                            o_index, d_index, t_index, m_index, u_index, p_index
                                                         )
                                                         
                                                         # Minimum flow constraints
-                                                        min_flow_left_expr = (
-                                                            self.parameters['flow_constraints_min'].get(
-                                                                (o_index, d_index, p_index, t_index, m_index, 'unit', u_index, g_index, g2_index), 0
-                                                            ) -
-                                                            (self.big_m * (1 - self.variables['is_launched'][o_index, t_index])
-                                                             if o_index != '@' and t_index != '@' else 0) - (
-                                                            self.big_m * (1 - self.variables['is_launched'][d_index, t_index])
-                                                             if d_index != '@' and t_index != '@' else 0)
-                                                        )
-                                                        min_flow_right_expr = pulp.lpSum(
-                                                            self.variables['departed_product_by_mode'][o,d,p,t,m] *
-                                                            self.parameters['products_measures'].get((p,u), self.big_m)
-                                                            for o in departing_nodes_list
-                                                            for d in receiving_nodes_list
-                                                            for t in periods_list
-                                                            for m in modes_list
-                                                            for p in products_list
-                                                            for u in measures_list
-                                                        )
-                                                        model += (
-                                                            min_flow_left_expr <= min_flow_right_expr,
+                                                        min_flow_left_expr = flow_min.get(flow_key, 0) - launch_slack
+                                                        self._leq(
+                                                            model, min_flow_left_expr, min_volume_expr,
                                                             f"flow_constraints_min_units_{t_index}_{o_index}_{d_index}_{m_index}_{u_index}_{p_index}_{g_index}_{g2_index}"
                                                         )
                                                         
                                                         # Maximum flow constraints
-                                                        max_flow_left_expr = self.parameters['flow_constraints_max'].get(
-                                                                (o_index, d_index, p_index, t_index, m_index, 'unit', u_index, g_index, g2_index),
-                                                                self.big_m
-                                                            )
-                                                        max_flow_right_expr = pulp.lpSum(
-                                                            self.variables['departed_product_by_mode'][o,d,p,t,m] *
-                                                            self.parameters['products_measures'].get((p,u), 0)
-                                                            for o in departing_nodes_list
-                                                            for d in receiving_nodes_list
-                                                            for t in periods_list
-                                                            for m in modes_list
-                                                            for p in products_list
-                                                            for u in measures_list
-                                                        )
-                                                        model += (
-                                                            max_flow_left_expr >= max_flow_right_expr,
+                                                        max_flow_left_expr = flow_max.get(flow_key, big_m)
+                                                        self._geq(
+                                                            model, max_flow_left_expr, volume_expr,
                                                             f"flow_constraints_max_units_{t_index}_{o_index}_{d_index}_{m_index}_{u_index}_{p_index}_{g_index}_{g2_index}"
                                                         )
 
@@ -342,380 +370,325 @@ class FlowConstraints(BaseConstraint):
                                                         #     )
                                                         # Minimum flow ib percentage constraints
                                                         if (d_index != '@' or g2_index != '@'):
-                                                            min_flow_ib_pct_left_expr = self.parameters['flow_constraints_min_pct_ib'].get(
-                                                                    (o_index, d_index, p_index, t_index, m_index, 'unit', u_index, g_index, g2_index),
-                                                                    0
-                                                                ) * pulp.lpSum(
-                                                                self.variables['departed_product_by_mode'][o,d,p,t,m] *
-                                                                self.parameters['products_measures'].get((p,u), 0)
-                                                                for o in self.network_sets['DEPARTING_NODES'] 
-                                                                for d in receiving_nodes_list
-                                                                for t in periods_list
-                                                                for m in modes_list
-                                                                for p in products_list
-                                                                for u in measures_list
-                                                            ) - (self.big_m * (1 - self.variables['is_launched'][o_index, t_index])
-                                                            if o_index != '@' and t_index != '@' else 0) - (
-                                                            self.big_m * (1 - self.variables['is_launched'][d_index, t_index])
-                                                            if d_index != '@' and t_index != '@' else 0)
-
-                                                            min_flow_ib_pct_right_expr = pulp.lpSum(
-                                                                self.variables['departed_product_by_mode'][o,d,p,t,m] *
-                                                                self.parameters['products_measures'].get((p,u), 0)
-                                                                for o in departing_nodes_list
-                                                                for d in receiving_nodes_list
-                                                                for t in periods_list
-                                                                for m in modes_list
-                                                                for p in products_list
-                                                                for u in measures_list
-                                                            )
-                                                            model += (
-                                                                min_flow_ib_pct_left_expr  <= min_flow_ib_pct_right_expr ,
+                                                            inbound_expr = departed_volume_exprs(
+                                                                '@', d_index, t_index, m_index, u_index, p_index
+                                                            )[0]
+                                                            min_pct = flow_min_pct_ib.get(flow_key, 0)
+                                                            min_flow_ib_pct_left_expr = pulp.LpAffineExpression(
+                                                                [(v, min_pct * coef) for v, coef in inbound_expr.items()]
+                                                                if min_pct != 0 else []
+                                                            ) - launch_slack
+                                                            self._leq(
+                                                                model, min_flow_ib_pct_left_expr, volume_expr,
                                                                 f"flow_constraints_min_ib_pct_units_{t_index}_{o_index}_{d_index}_{m_index}_{u_index}_{p_index}_{g_index}_{g2_index}"
                                                             )
                                                         # Maximum flow ib percentage constraints
-                                                            max_flow_ib_pct_left_expr = self.parameters['flow_constraints_max_pct_ib'].get(
-                                                                    (o_index, d_index, p_index, t_index, m_index, 'unit', u_index, g_index, g2_index),
-                                                                    self.big_m
-                                                                ) * pulp.lpSum(
-                                                                self.variables['departed_product_by_mode'][o,d,p,t,m] *
-                                                                self.parameters['products_measures'].get((p,u), 0)
-                                                                for o in self.network_sets['DEPARTING_NODES'] 
-                                                                for d in receiving_nodes_list
-                                                                for t in periods_list
-                                                                for m in modes_list
-                                                                for p in products_list
-                                                                for u in measures_list
-                                                            )
-                                                            max_flow_ib_pct_right_expr = pulp.lpSum(
-                                                                self.variables['departed_product_by_mode'][o,d,p,t,m] *
-                                                                self.parameters['products_measures'].get((p,u), 0)
-                                                                for o in departing_nodes_list
-                                                                for d in receiving_nodes_list
-                                                                for t in periods_list
-                                                                for m in modes_list
-                                                                for p in products_list
-                                                                for u in measures_list
+                                                            max_pct = flow_max_pct_ib.get(flow_key, big_m)
+                                                            max_flow_ib_pct_left_expr = pulp.LpAffineExpression(
+                                                                [(v, max_pct * coef) for v, coef in inbound_expr.items()]
+                                                                if max_pct != 0 else []
                                                             )
-                                                            model += (
-                                                                max_flow_ib_pct_left_expr  >= max_flow_ib_pct_right_expr ,
+                                                            self._geq(
+                                                                model, max_flow_ib_pct_left_expr, volume_expr,
                                                                 f"flow_constraints_max_ib_pct_units_{t_index}_{o_index}_{d_index}_{m_index}_{u_index}_{p_index}_{g_index}_{g2_index}"
                                                             )
 
 
         # Add connection constraints if specified
-        if (self.parameters.get('flow_constraints_min_connections') or 
-            self.parameters.get('flow_constraints_max_connections')):
+        if flow_min_connections or flow_max_connections:
             
             for o_index in departing_nodes:
                 for g_index in nodegroups:
-                    if o_index == '@' or self.parameters['node_in_nodegroup'].get((o_index, g_index), 0) == 1:
+                    if o_index == '@' or (o_index, g_index) in node_group_pairs:
                         
                         if o_index == '@' and g_index != '@':
                             from_nodes = [
-                                n for n in self.network_sets['DEPARTING_NODES'] 
-                                if self.parameters['node_in_nodegroup'].get((n, g_index), 0) == 1
+                                n for n in all_departing_nodes 
+                                if (n, g_index) in node_group_pairs
                             ]
                         else:
-                            from_nodes = self.network_sets['DEPARTING_NODES']
+                            from_nodes = all_departing_nodes
                         
                         departing_nodes_list = from_nodes if o_index == '@' else [o_index]
                         
                         for d_index in receiving_nodes:
                             for g2_index in nodegroups:
-                                if d_index == '@' or self.parameters['node_in_nodegroup'].get((d_index, g2_index), 0) == 1:
+                                if d_index == '@' or (d_index, g2_index) in node_group_pairs:
                                     
                                     if d_index == '@' and g2_index != '@':
                                         to_nodes = [
-                                            n for n in self.network_sets['RECEIVING_NODES']
-                                            if self.parameters['node_in_nodegroup'].get((n, g2_index), 0) == 1
+                                            n for n in all_receiving_nodes
+                                            if (n, g2_index) in node_group_pairs
                                         ]
                                     else:
-                                        to_nodes = self.network_sets['RECEIVING_NODES']
+                                        to_nodes = all_receiving_nodes
                                     
                                     receiving_nodes_list = to_nodes if d_index == '@' else [d_index]
                                     
                                     for t_index in periods:
                                         periods_list = (
-                                            self.network_sets['PERIODS'] 
+                                            all_periods 
                                             if t_index == '@' else [t_index]
                                         )
+
+                                        # The minimum counts connections between distinct nodes only
+                                        connections = list(product(
+                                            departing_nodes_list, receiving_nodes_list, periods_list
+                                        ))
+                                        connections_expr = pulp.LpAffineExpression(
+                                            (assigned[o,d,t], 1) for o, d, t in connections
+                                        )
+                                        min_conn_right_expr = pulp.LpAffineExpression(
+                                            (assigned[o,d,t], 1) for o, d, t in connections if o != d
+                                        )
+                                        if t_index != '@':
+                                            for n in (o_index, d_index):
+                                                if n != '@':
+                                                    min_conn_right_expr = min_conn_right_expr + big_m * (1 - is_launched[n, t_index])
                                         
                                         for m_index in modes:
                                             for u_index in measures:
                                                 for p_index in products:
+                                                    flow_key = (o_index, d_index, p_index, t_index, m_index, 'unit', u_index, g_index, g2_index)
+
                                                     # Minimum connections constraints
-                                                    min_conn_left_expr = (
-                                                        self.parameters['flow_constraints_min_connections'].get(
-                                                            (o_index, d_index, p_index, t_index, m_index, 'unit', u_index, g_index, g2_index),
-                                                            0
-                                                        )
-                                                    )
-                                                    min_conn_right_expr = (
-                                                        pulp.lpSum(
-                                                            self.variables['is_destination_assigned_to_origin'][o,d,t]
-                                                            for o in departing_nodes_list
-                                                            for d in receiving_nodes_list
-                                                            for t in periods_list
-                                                            if o != d 
-                                                        ) +
-                                                        (self.big_m * (1 - self.variables['is_launched'][o_index, t_index])
-                                                         if o_index != '@' and t_index != '@' else 0) +
-                                                        (self.big_m * (1 - self.variables['is_launched'][d_index, t_index])
-                                                         if d_index != '@' and t_index != '@' else 0)
-                                                    )
-                                                    model += (
-                                                        min_conn_left_expr <= min_conn_right_expr,
+                                                    min_conn_left_expr = flow_min_connections.get(flow_key, 0)
+                                                    self._leq(
+                                                        model, min_conn_left_expr, min_conn_right_expr,
                                                         f"flow_constraints_min_connections_{t_index}_{o_index}_{d_index}_{m_index}_{u_index}_{p_index}_{g_index}_{g2_index}"
                                                     )
                                                     
                                                     # Maximum connections constraints
-                                                    max_conn_left_expr = (
-                                                        self.parameters['flow_constraints_max_connections'].get(
-                                                            (o_index, d_index, p_index, t_index, m_index, 'unit', u_index, g_index, g2_index),
-                                                            self.big_m
-                                                        )
-                                                    )
-                                                    max_conn_right_expr = pulp.lpSum(
-                                                        self.variables['is_destination_assigned_to_origin'][o,d,t]
-                                                        for o in departing_nodes_list
-                                                        for d in receiving_nodes_list
-                                                        for t in periods_list
-                                                    )
-                                                    model += (
-                                                        max_conn_left_expr >= max_conn_right_expr,
+                                                    max_conn_left_expr = flow_max_connections.get(flow_key, big_m)
+                                                    self._geq(
+                                                        model, max_conn_left_expr, connections_expr,
                                                         f"flow_constraints_max_connections_{t_index}_{o_index}_{d_index}_{m_index}_{u_index}_{p_index}_{g_index}_{g2_index}"
                                                     )
 
     def _build_destination_assignment_constraints(self, model: pulp.LpProblem) -> None:
         """Build constraints for destination assignments"""
+        products = tuple(self.network_sets['PRODUCTS'])
+        departed = self.variables['departed_product']
+        assigned = self.variables['is_destination_assigned_to_origin']
         for o, d, t in product(
-            self.network_sets['DEPARTING_NODES'],
-            self.network_sets['RECEIVING_NODES'],
-            self.network_sets['PERIODS']
+            tuple(self.network_sets['DEPARTING_NODES']),
+            tuple(self.network_sets['RECEIVING_NODES']),
+            tuple(self.network_sets['PERIODS'])
         ):
             # Upper bound constraint
-            expr1 = (
-                self.variables['is_destination_assigned_to_origin'][o,d,t] <= 
-                pulp.lpSum(
-                    self.variables['departed_product'][o,d,p,t] * 9999 
-                    for p in self.network_sets['PRODUCTS']
-                )
+            expr1 = pulp.LpAffineExpression(
+                (departed[o,d,p,t], -9999)
+                for p in products
             )
-            model += (expr1, f"is_destination_assigned_{o}_{d}_{t}_1")
+            expr1.addInPlace(assigned[o,d,t])
+            self._leq(model, expr1, 0, f"is_destination_assigned_{o}_{d}_{t}_1")
             
             # Lower bound constraint
-            expr2 = (
-                self.variables['is_destination_assigned_to_origin'][o,d,t] * 
-                self.big_m >= 
-                pulp.lpSum(
-                    self.variables['departed_product'][o,d,p,t] 
-                    for p in self.network_sets['PRODUCTS']
-                )
+            expr2 = pulp.LpAffineExpression(
+                (departed[o,d,p,t], -1)
+                for p in products
             )
-            model += (expr2, f"is_destination_assigned_{o}_{d}_{t}_2")
+            expr2.addterm(assigned[o,d,t], self.big_m)
+            self._geq(model, expr2, 0, f"is_destination_assigned_{o}_{d}_{t}_2")
     
     def _build_mode_aggregation_constraints(self, model: pulp.LpProblem) -> None:
         """Build constraints that aggregate flows across modes"""
+        modes = tuple(self.network_sets['MODES'])
+        departed = self.variables['departed_product']
+        departed_by_mode = self.variables['departed_product_by_mode']
         for n_d, n_r, t, p in product(
-            self.network_sets['DEPARTING_NODES'],
-            self.network_sets['RECEIVING_NODES'],
-            self.network_sets['PERIODS'],
-            self.network_sets['PRODUCTS']
+            tuple(self.network_sets['DEPARTING_NODES']),
+            tuple(self.network_sets['RECEIVING_NODES']),
+            tuple(self.network_sets['PERIODS']),
+            tuple(self.network_sets['PRODUCTS'])
         ):
-            constraint_expr = pulp.lpSum(
-                self.variables['departed_product_by_mode'][n_d, n_r, p, t, m] 
-                for m in self.network_sets['MODES']
+            constraint_expr = pulp.LpAffineExpression(
+                (departed_by_mode[n_d, n_r, p, t, m], 1)
+                for m in modes
             )
-            model += (
-                self.variables['departed_product'][n_d, n_r, p, t] == constraint_expr,
+            self._eq(
+                model, departed[n_d, n_r, p, t], constraint_expr,
                 f"departed_product_mode_sum_{n_d}_{n_r}_{t}_{p}"
             )
 
     def _build_arrival_constraints(self, model: pulp.LpProblem) -> None:
         """Build constraints related to product arrivals"""
+        arrived = self.variables['arrived_product']
+        departed_by_mode = self.variables['departed_product_by_mode']
+        departures_by_arrival = self._get_departures_by_arrival()
+
+        # Assemble arrived - departures == 0 as a sparse matrix; every variable
+        # appears in at most one row, so each nonzero gets its own column
+        rows, cols, data, columns, names = [], [], [], [], []
         for n_r, t, p in product(
             self.network_sets['RECEIVING_NODES'],
             self.network_sets['PERIODS'],
             self.network_sets['PRODUCTS']
         ):
-            expr = (
-                self.variables['arrived_product'][n_r, p, t] == 
-                pulp.lpSum(
-                    self.variables['departed_product_by_mode'][n_d, n_r, p, t2, m] 
-                    for n_d in self.network_sets['DEPARTING_NODES'] 
-                    for m in self.network_sets['MODES'] 
-                    for t2 in self.network_sets['PERIODS'] 
-                    if int(t2) == int(t) - int(self.parameters['transport_periods'].get((n_d, n_r, m), 0))
-                )
-            )
-            model += (expr, f"Arrived_Equals_Departed_Constraint_{n_r}_{t}_{p}")
+            i = len(names)
+            names.append(f"Arrived_Equals_Departed_Constraint_{n_r}_{t}_{p}")
+            rows.append(i)
+            cols.append(len(columns))
+            data.append(1)
+            columns.append(arrived[n_r, p, t])
+            for n_d, m, t2 in departures_by_arrival.get((n_r, t), ()):
+                rows.append(i)
+                cols.append(len(columns))
+                data.append(-1)
+                columns.append(departed_by_mode[n_d, n_r, p, t2, m])
+        self._emit_rows(model, rows, cols, data, columns,
+                        [pulp.LpConstraintEQ] * len(names), [0] * len(names), names)
 
     def _build_processing_constraints(self, model: pulp.LpProblem) -> None:
         """Build constraints related to product processing"""
-        for n_r, t, p, g in product(
+        previous_period = self.previous_period
+        groups_of_node = self.groups_of_node
+        delay_periods = self.parameters['delay_periods']
+        capacity_consumption_periods = self.parameters['capacity_consumption_periods']
+        origins = set(self.network_sets['ORIGINS'])
+        processed = self.variables['processed_product']
+        ib_carried_over = self.variables['ib_carried_over_demand']
+        arrived = self.variables['arrived_product']
+        dropped = self.variables['dropped_demand']
+        completed = self.variables['arrived_and_completed_product']
+
+        # Processing periods indexed by the period their volume is released
+        released_by_period = self._get_release_periods(delay_periods, capacity_consumption_periods)
+
+        for n_r, t, p in product(
             self.network_sets['RECEIVING_NODES'],
             self.network_sets['PERIODS'],
-            self.network_sets['PRODUCTS'],
-            self.network_sets['NODEGROUPS']
+            self.network_sets['PRODUCTS']
         ):
-            if self.parameters['node_in_nodegroup'].get((n_r, g), 0) == 1:
-                if n_r not in self.network_sets['ORIGINS']:
-                    if int(t) > 1:
-                        expr = (
-                            self.variables['processed_product'][n_r, p, t] + 
-                            self.variables['ib_carried_over_demand'][n_r, p, t] <= 
-                            self.variables['arrived_product'][n_r, p, t] + 
-                            self.variables['ib_carried_over_demand'][n_r, p, str(int(t)-1)] - 
-                            self.variables['dropped_demand'][n_r, p, t] - 
-                            self.variables['arrived_and_completed_product'][t, p, n_r]
-                        )
-                    else:
-                        expr = (
-                            self.variables['processed_product'][n_r, p, t] + 
-                            self.variables['ib_carried_over_demand'][n_r, p, t] <= 
-                            self.variables['arrived_product'][n_r, p, t] - 
-                            self.variables['dropped_demand'][n_r, p, t] - 
-                            self.variables['arrived_and_completed_product'][t, p, n_r]
-                        )
+            for g in groups_of_node.get(n_r, ()):
+                if n_r not in origins:
+                    # Processed plus carried over, less what arrived (and was carried in)
+                    expr = pulp.LpAffineExpression([
+                        (processed[n_r, p, t], 1),
+                        (ib_carried_over[n_r, p, t], 1),
+                        (arrived[n_r, p, t], -1),
+                        (dropped[n_r, p, t], 1),
+                        (completed[t, p, n_r], 1)
+                    ])
+                    if t in previous_period:
+                        expr.subInPlace(ib_carried_over[n_r, p, previous_period[t]])
+                    self._leq(model, expr, 0, f"Processed_Less_Than_Arrived_Constraint_{n_r}_{t}_{g}")
                 else:
-                    expr = (
-                        pulp.lpSum(
-                            self.variables['processed_product'][n_r, p, t2] 
-                            for t2 in self.network_sets['PERIODS'] 
-                            if int(t2) == int(t) - 
-                               int(self.parameters['delay_periods'].get((t2, n_r, p, g), 0)) - 
-                               int(self.parameters['capacity_consumption_periods'].get((t2, n_r, p, g), 0))
-                        ) >= 
-                        self.variables['arrived_and_completed_product'][t, p, n_r] - 
-                        self.variables['dropped_demand'][n_r, p, t]
+                    expr = pulp.LpAffineExpression(
+                        (processed[n_r, p, t2], 1)
+                        for t2 in released_by_period.get((n_r, p, g, t), (t,))
                     )
-                model += (expr, f"Processed_Less_Than_Arrived_Constraint_{n_r}_{t}_{g}")
+                    expr.subInPlace(completed[t, p, n_r])
+                    expr.addInPlace(dropped[n_r, p, t])
+                    self._geq(model, expr, 0, f"Processed_Less_Than_Arrived_Constraint_{n_r}_{t}_{g}")
 
     def _build_departure_constraints(self, model: pulp.LpProblem) -> None:
         """Build constraints related to product departures"""
-        for n_d, t, p, g in product(
-            self.network_sets['DEPARTING_NODES'],
+        previous_period = self.previous_period
+        groups_of_node = self.groups_of_node
+        capacity_consumption_periods = self.parameters['capacity_consumption_periods']
+        origins = set(self.network_sets['ORIGINS'])
+        receiving_nodes = tuple(self.network_sets['RECEIVING_NODES'])
+        departed = self.variables['departed_product']
+        processed = self.variables['processed_product']
+        ob_carried_over = self.variables['ob_carried_over_demand']
+
+        # Origins have no departure balance of their own; their outflow is
+        # bounded by the origin demand constraints instead
+        departing_nodes = [n for n in self.network_sets['DEPARTING_NODES'] if n not in origins]
+
+        # Processing periods indexed by the period their volume can depart
+        released_by_period = self._get_release_periods(capacity_consumption_periods)
+
+        for n_d, t, p in product(
+            departing_nodes,
             self.network_sets['PERIODS'],
-            self.network_sets['PRODUCTS'],
-            self.network_sets['NODEGROUPS']
+            self.network_sets['PRODUCTS']
         ):
-            if self.parameters['node_in_nodegroup'].get((n_d, g), 0) == 1:
-                if n_d not in self.network_sets['ORIGINS']:
-                    if int(t) > 1:
-                        expr = (
-                            pulp.lpSum(
-                                self.variables['departed_product'][n_d, n_r, p, t] 
-                                for n_r in self.network_sets['RECEIVING_NODES']
-                            ) + 
-                            self.variables['ob_carried_over_demand'][n_d, p, t] <= 
-                            pulp.lpSum(
-                                self.variables['processed_product'][n_d, p, t2] 
-                                for t2 in self.network_sets['PERIODS'] 
-                                if int(t2) == int(t) - 
-                                   int(self.parameters['delay_periods'].get((t2, n_d, p), 0)) - 
-                                   int(self.parameters['capacity_consumption_periods'].get((t2, n_d, p, g), 0))
-                            ) + 
-                            self.variables['ob_carried_over_demand'][n_d, p, str(int(t)-1)]
-                        )
-                    else:
-                        expr = (
-                            pulp.lpSum(
-                                self.variables['departed_product'][n_d, n_r, p, t] 
-                                for n_r in self.network_sets['RECEIVING_NODES']
-                            ) + 
-                            self.variables['ob_carried_over_demand'][n_d, p, t] <= 
-                            pulp.lpSum(
-                                self.variables['processed_product'][n_d, p, t2] 
-                                for t2 in self.network_sets['PERIODS'] 
-                                if int(t2) == int(t) - 
-                                   int(self.parameters['delay_periods'].get((t2, n_d, p), 0)) - 
-                                   int(self.parameters['capacity_consumption_periods'].get((t2, n_d, p, g), 0))
-                            )
-                        )
-                model += (expr, f"Depart_Less_Than_Processed_Constraint_{n_d}_{t}_{p}_{g}")
+            for g in groups_of_node.get(n_d, ()):
+                # Departures plus carried over, less processed (and carried in)
+                expr = pulp.LpAffineExpression(
+                    (departed[n_d, n_r, p, t], 1)
+                    for n_r in receiving_nodes
+                )
+                expr.addInPlace(ob_carried_over[n_d, p, t])
+                expr.subInPlace(
+                    processed[n_d, p, t2] 
+                    for t2 in released_by_period.get((n_d, p, g, t), (t,))
+                )
+                if t in previous_period:
+                    expr.subInPlace(ob_carried_over[n_d, p, previous_period[t]])
+                self._leq(model, expr, 0, f"Depart_Less_Than_Processed_Constraint_{n_d}_{t}_{p}_{g}")
 
     def _build_destination_demand_constraints(self, model: pulp.LpProblem) -> None:
         """Build constraints related to destination demand"""
-        for t, p, d, g in product(
+        previous_period = self.previous_period
+        groups_of_node = self.groups_of_node
+        delay_periods = self.parameters['delay_periods']
+        capacity_consumption_periods = self.parameters['capacity_consumption_periods']
+        origins = set(self.network_sets['ORIGINS'])
+        receiving_nodes = tuple(self.network_sets['RECEIVING_NODES'])
+        completed = self.variables['arrived_and_completed_product']
+        arrived = self.variables['arrived_product']
+        dropped = self.variables['dropped_demand']
+        processed = self.variables['processed_product']
+        departed = self.variables['departed_product']
+        ib_carried_over = self.variables['ib_carried_over_demand']
+        ob_carried_over = self.variables['ob_carried_over_demand']
+
+        # Processing periods indexed by the period their volume is released
+        released_by_period = self._get_release_periods(delay_periods, capacity_consumption_periods)
+
+        for t, p, d in product(
             self.network_sets['PERIODS'],
             self.network_sets['PRODUCTS'],
-            self.network_sets['DESTINATIONS'],
-            self.network_sets['NODEGROUPS']
+            self.network_sets['DESTINATIONS']
         ):
-            if self.parameters['node_in_nodegroup'].get((d, g), 0) == 1:
-                if d not in self.network_sets['ORIGINS']:
-                    if int(t) > 1:
-                        expr = (
-                            self.variables['arrived_and_completed_product'][t, p, d] <= 
-                            self.variables['arrived_product'][d, p, t] - 
-                            self.variables['dropped_demand'][d, p, t] - 
-                            self.variables['ib_carried_over_demand'][d, p, t] - 
-                            self.variables['processed_product'][d, p, t] + 
-                            self.variables['ib_carried_over_demand'][d, p, str(int(t)-1)]
-                        )
-                    else:
-                        expr = (
-                            self.variables['arrived_and_completed_product'][t, p, d] <= 
-                            self.variables['arrived_product'][d, p, t] - 
-                            self.variables['dropped_demand'][d, p, t] - 
-                            self.variables['ib_carried_over_demand'][d, p, t] - 
-                            self.variables['processed_product'][d, p, t]
-                        )
+            for g in groups_of_node.get(d, ()):
+                if d not in origins:
+                    # Completed demand plus everything else drawn from arrivals
+                    expr = pulp.LpAffineExpression([
+                        (completed[t, p, d], 1),
+                        (arrived[d, p, t], -1),
+                        (dropped[d, p, t], 1),
+                        (ib_carried_over[d, p, t], 1),
+                        (processed[d, p, t], 1)
+                    ])
+                    if t in previous_period:
+                        expr.subInPlace(ib_carried_over[d, p, previous_period[t]])
                 else:
-                    if int(t) > 1:
-                        expr = (
-                            self.variables['arrived_and_completed_product'][t, p, d] + 
-                            self.variables['ob_carried_over_demand'][d, p, t] + 
-                            pulp.lpSum(
-                                self.variables['departed_product'][d, n_r, p, t] 
-                                for n_r in self.network_sets['RECEIVING_NODES']
-                            ) <= 
-                            pulp.lpSum(
-                                self.variables['processed_product'][d, p, t2] 
-                                for t2 in self.network_sets['PERIODS'] 
-                                if int(t2) == int(t) - 
-                                   int(self.parameters['delay_periods'].get((t2, d, p, g), 0)) - 
-                                   int(self.parameters['capacity_consumption_periods'].get((t2, d, p, g), 0))
-                            ) + 
-                            self.variables['ob_carried_over_demand'][d, p, str(int(t)-1)]
-                        )
-                    else:
-                        expr = (
-                            self.variables['arrived_and_completed_product'][t, p, d] + 
-                            self.variables['ob_carried_over_demand'][d, p, t] + 
-                            pulp.lpSum(
-                                self.variables['departed_product'][d, n_r, p, t] 
-                                for n_r in self.network_sets['RECEIVING_NODES']
-                            ) <= 
-                            pulp.lpSum(
-                                self.variables['processed_product'][d, p, t2] 
-                                for t2 in self.network_sets['PERIODS'] 
-                                if int(t2) == int(t) - 
-                                   int(self.parameters['delay_periods'].get((t2, d, p, g), 0)) - 
-                                   int(self.parameters['capacity_consumption_periods'].get((t2, d, p, g), 0))
-                            )
-                        )
-                model += (expr, f"minimum_destination_demand_processed_{t}_{p}_{d}_{g}")
+                    # Completed demand plus departures, less what was processed
+                    expr = pulp.LpAffineExpression(
+                        (departed[d, n_r, p, t], 1)
+                        for n_r in receiving_nodes
+                    )
+                    expr.addInPlace(completed[t, p, d])
+                    expr.addInPlace(ob_carried_over[d, p, t])
+                    expr.subInPlace(
+                        processed[d, p, t2] 
+                        for t2 in released_by_period.get((d, p, g, t), (t,))
+                    )
+                    if t in previous_period:
+                        expr.subInPlace(ob_carried_over[d, p, previous_period[t]])
+                self._leq(model, expr, 0, f"minimum_destination_demand_processed_{t}_{p}_{d}_{g}")
 
     def _build_origin_demand_constraints(self, model: pulp.LpProblem) -> None:
         """Build constraints related to origin demand"""
-        for t, p in product(
-            self.network_sets['PERIODS'],
-            self.network_sets['PRODUCTS']
-        ):
-            expr = (
-                pulp.lpSum(
-                    self.variables['arrived_and_completed_product'][t, p, d] 
-                    for d in self.network_sets['DESTINATIONS']
-                ) <= 
-                pulp.lpSum(
-                    self.variables['processed_product'][o, p, t2] 
-                    for o, t2 in product(
-                        self.network_sets['ORIGINS'],
-                        self.network_sets['PERIODS']
-                    ) 
-                    if int(t2) <= int(t)
-                )
+        period_index = self.period_index
+        periods = tuple(self.network_sets['PERIODS'])
+        origins = tuple(self.network_sets['ORIGINS'])
+        destinations = tuple(self.network_sets['DESTINATIONS'])
+        completed = self.variables['arrived_and_completed_product']
+        processed = self.variables['processed_product']
+        for t, p in product(periods, tuple(self.network_sets['PRODUCTS'])):
+            # Completed demand at destinations, less what origins processed to date
+            expr = pulp.LpAffineExpression(
+                (completed[t, p, d], 1)
+                for d in destinations
+            )
+            expr.subInPlace(
+                processed[o, p, t2] 
+                for o, t2 in product(origins, periods) 
+                if period_index[t2] <= period_index[t]
             )
-            model += (expr, f"minimum_origin_demand_processed_{t}_{p}")
\ No newline at end of file
+            self._leq(model, expr, 0, f"minimum_origin_demand_processed_{t}_{p}")
@@ -1,4 +1,5 @@
 from itertools import product
+import numpy as np
 import pulp
 from .base_constraint import BaseConstraint
 
@@ -7,271 +8,310 @@ class ResourceConstraints(BaseConstraint):
 
     def build(self, model: pulp.LpProblem) -> None:
         """Build resource constraints"""
+        self._build_resource_node_period_constraints(model)
         self._build_resource_assignment_constraints(model)
         self._build_resource_capacity_constraints(model)
         self._build_resource_attribute_constraints(model)
-        self._build_resource_binary_constraints(model)
         self._build_resource_cost_constraints(model)
         self._build_resource_attribute_limits_constraints(model)
         self._build_resource_utilization_constraints(model)
 
-    def _build_resource_assignment_constraints(self, model: pulp.LpProblem) -> None:
-        """Constraints for resource assignment across periods and node groups"""
-        # Initial period resource assignment
-        for r, n, t, g in product(
-            self.network_sets['RESOURCES'], 
-            self.network_sets['NODES'], 
-            self.network_sets['PERIODS'], 
-            self.network_sets['NODEGROUPS']
-        ):
-            if self.parameters['node_in_nodegroup'].get((n,g), 0) == 1:
-                if int(t) == 1:
+    def _build_resource_node_period_constraints(self, model: pulp.LpProblem) -> None:
+        """Constraints for resource assignment, addition/removal and cost per node and period
+        
+        The assignment balance, the binary and cohort bounds on additions and
+        removals, and the cost rows share one pass over resources, nodes,
+        periods and the node's groups.
+        """
+        resources_assigned = self.variables['resources_assigned']
+        resources_added = self.variables['resources_added']
+        resources_removed = self.variables['resources_removed']
+        resources_added_binary = self.variables['resources_added_binary']
+        resources_removed_binary = self.variables['resources_removed_binary']
+        resource_cohorts_added = self.variables['resource_cohorts_added']
+        resource_cohorts_removed = self.variables['resource_cohorts_removed']
+        resource_add_cost = self.variables['resource_add_cost']
+        resource_remove_cost = self.variables['resource_remove_cost']
+        resource_time_cost = self.variables['resource_time_cost']
+        initial_count = self.parameters['resource_node_initial_count'].get
+        add_cohort_count = self.parameters['resource_add_cohort_count'].get
+        remove_cohort_count = self.parameters['resource_remove_cohort_count'].get
+        fixed_add_cost = self.parameters['resource_fixed_add_cost'].get
+        fixed_remove_cost = self.parameters['resource_fixed_remove_cost'].get
+        cost_per_time = self.parameters['resource_cost_per_time'].get
+        # Walk the (r, n, t) keys the assignment variables were created for, so a
+        # sparsely built variable dict never yields rows for missing variables
+        for rnt in resources_assigned:
+            r, n, t = rnt
+            # Build each key tuple once so every lookup below reuses its cached hash
+            tnr = (t, n, r)
+            assigned = resources_assigned[rnt]
+            added = resources_added[rnt]
+            removed = resources_removed[rnt]
+            cohorts_added = resource_cohorts_added[rnt]
+            cohorts_removed = resource_cohorts_removed[rnt]
+
+            # Bounds for resources added
+            self._add_constraint(
+                model,
+                pulp.LpAffineExpression([(added, 1), (resources_added_binary[rnt], -self.big_m)]),
+                pulp.LpConstraintLE,
+                f"resource_added_binary_lb_{r}_{t}_{n}"
+            )
+            self._add_constraint(
+                model,
+                pulp.LpAffineExpression([(added, 1), (resources_added_binary[rnt], -1)]),
+                pulp.LpConstraintGE,
+                f"resource_added_binary_ub_{r}_{t}_{n}"
+            )
+            
+            # Bounds for resources removed
+            self._add_constraint(
+                model,
+                pulp.LpAffineExpression([(removed, 1), (resources_removed_binary[rnt], -self.big_m)]),
+                pulp.LpConstraintLE,
+                f"resource_removed_binary_lb_{r}_{t}_{n}"
+            )
+            self._add_constraint(
+                model,
+                pulp.LpAffineExpression([(removed, 1), (resources_removed_binary[rnt], -1)]),
+                pulp.LpConstraintGE,
+                f"resource_removed_binary_ub_{r}_{t}_{n}"
+            )
+
+            for g in self.groups_of_node.get(n, ()):
+                key = (t, n, r, g)
+                if self.period_index[t] == 1:
                     # First period: initial resources + added - removed
-                    expr = (self.variables['resources_assigned'][r,n,t] == 
-                            self.parameters['resource_node_initial_count'].get((n,r,g), 0) + 
-                            self.variables['resources_added'][r,n,t] - 
-                            self.variables['resources_removed'][r,n,t])
-                    model += (expr, f"initial_resources_assigned_{r}_{n}_{t}_{g}")
+                    self._add_constraint(
+                        model,
+                        pulp.LpAffineExpression([(assigned, 1), (added, -1), (removed, 1)]),
+                        pulp.LpConstraintEQ,
+                        f"initial_resources_assigned_{r}_{n}_{t}_{g}",
+                        initial_count((n,r,g), 0)
+                    )
                 else:
                     # Subsequent periods: previous period resources + added - removed
-                    expr = (self.variables['resources_assigned'][r,n,t] == 
-                            self.variables['resources_assigned'][r,n,str(int(t)-1)] + 
-                            self.variables['resources_added'][r,n,t] - 
-                            self.variables['resources_removed'][r,n,t])
-                    model += (expr, f"resources_assigned_after_{r}_{n}_{t}_{g}")
+                    self._add_constraint(
+                        model,
+                        pulp.LpAffineExpression([
+                            (assigned, 1),
+                            (resources_assigned[r,n,self.previous_period[t]], -1),
+                            (added, -1),
+                            (removed, 1)
+                        ]),
+                        pulp.LpConstraintEQ,
+                        f"resources_assigned_after_{r}_{n}_{t}_{g}"
+                    )
+
+                # Cohort-based constraints for resource addition and removal
+                add_cohort = add_cohort_count(key, 1)
+                remove_cohort = remove_cohort_count(key, 1)
+                self._geq(
+                    model,
+                    added,
+                    cohorts_added * add_cohort,
+                    f"resources_added_{r}_{t}_{n}_{g}"
+                )
+                self._geq(
+                    model,
+                    removed,
+                    cohorts_removed * remove_cohort,
+                    f"resources_removed_{r}_{t}_{n}_{g}"
+                )
+
+                # A zero cost pins the cost variable to zero; bound it rather than emit a row
+                # Resource addition cost
+                add_cost = add_cohort * fixed_add_cost(key, 0)
+                if add_cost == 0:
+                    resource_add_cost[tnr].upBound = 0
+                else:
+                    self._eq(
+                        model,
+                        resource_add_cost[tnr],
+                        cohorts_added * add_cost,
+                        f"resources_added_cost_{r}_{t}_{n}_{g}"
+                    )
+                
+                # Resource removal cost
+                remove_cost = remove_cohort * fixed_remove_cost(key, 0)
+                if remove_cost == 0:
+                    resource_remove_cost[tnr].upBound = 0
+                else:
+                    self._eq(
+                        model,
+                        resource_remove_cost[tnr],
+                        cohorts_removed * remove_cost,
+                        f"resources_removed_cost_{r}_{t}_{n}_{g}"
+                    )
+                
+                # Resource time-based cost (already implied by the zero lower bound when free)
+                time_cost = cost_per_time(key, 0)
+                if time_cost != 0:
+                    self._geq(
+                        model,
+                        resource_time_cost[tnr],
+                        assigned * time_cost,
+                        f"resources_time_cost_{r}_{t}_{n}_{g}"
+                    )
+
+    def _build_resource_assignment_constraints(self, model: pulp.LpProblem) -> None:
+        """Constraints for initial resource counts aggregated over nodes and node groups"""
+        # Node, group and network-level initial resources, emitted in one pass
+        # over the first period from the node/group memberships
+        resources_assigned = self.variables['resources_assigned']
+        resources_added = self.variables['resources_added']
+        resources_removed = self.variables['resources_removed']
+        initial_count = self.parameters['resource_node_initial_count']
+        # A node's variables appear once per group it belongs to, so the node-level and
+        # network-level sums collapse to a single term weighted by the node's group count
+        group_count = {n: len(groups) for n, groups in self.groups_of_node.items()}
+        first_periods = [t for t in self.network_sets['PERIODS'] if self.period_index[t] == 1]
+
+        for r, t in product(self.network_sets['RESOURCES'], first_periods):
+            # Net change terms (assigned - added + removed) per node, shared by all three levels
+            net_terms = {
+                n: [
+                    (resources_assigned[r,n,t], 1),
+                    (resources_added[r,n,t], -1),
+                    (resources_removed[r,n,t], 1)
+                ]
+                for n in self.network_sets['NODES']
+            }
+            total_terms = []
 
-        # Additional aggregation constraints for initial resources
-        for r, n, t in product(
-            self.network_sets['RESOURCES'], 
-            self.network_sets['NODES'], 
-            self.network_sets['PERIODS']
-        ):
             # Node-level initial resource check
-            if int(t) == 1 and self.parameters['resource_node_initial_count'].get((n,r,'@'), None):
-                expr = (
-                    pulp.lpSum(self.variables['resources_assigned'][r,n,t] * 
-                            self.parameters['node_in_nodegroup'].get((n,g), 0) 
-                            for g in self.network_sets['NODEGROUPS']) == 
-                    self.parameters['resource_node_initial_count'].get((n,r,'@'), 0) + 
-                    pulp.lpSum(
-                        self.variables['resources_added'][r,n,t] * 
-                        self.parameters['node_in_nodegroup'].get((n,g), 0) - 
-                        self.variables['resources_removed'][r,n,t] * 
-                        self.parameters['node_in_nodegroup'].get((n,g), 0) 
-                        for g in self.network_sets['NODEGROUPS']
+            for n, terms in net_terms.items():
+                count = group_count.get(n, 0)
+                if count:
+                    total_terms.extend((var, coef * count) for var, coef in terms)
+                if initial_count.get((n,r,'@'), None):
+                    self._add_constraint(
+                        model,
+                        pulp.LpAffineExpression([(var, coef * count) for var, coef in terms]),
+                        pulp.LpConstraintEQ,
+                        f"initial_resources_assigned_{r}_{n}_{t}",
+                        initial_count[(n,r,'@')]
                     )
-                )
-                model += (expr, f"initial_resources_assigned_{r}_{n}_{t}")
 
-        # Resource-level constraints
-        for r, t, g in product(
-            self.network_sets['RESOURCES'], 
-            self.network_sets['PERIODS'], 
-            self.network_sets['NODEGROUPS']
-        ):
             # Aggregate resources by group
-            if int(t) == 1 and self.parameters['resource_node_initial_count'].get(('@',r,g), None):
-                expr = (
-                    pulp.lpSum(self.variables['resources_assigned'][r,n,t] * 
-                            self.parameters['node_in_nodegroup'].get((n,g), 0) 
-                            for n in self.network_sets['NODES']) == 
-                    self.parameters['resource_node_initial_count'].get(('@',r,g), 0) + 
-                    pulp.lpSum(
-                        self.variables['resources_added'][r,n,t] * 
-                        self.parameters['node_in_nodegroup'].get((n,g), 0) - 
-                        self.variables['resources_removed'][r,n,t] * 
-                        self.parameters['node_in_nodegroup'].get((n,g), 0) 
-                        for n in self.network_sets['NODES']
+            for g in self.network_sets['NODEGROUPS']:
+                if initial_count.get(('@',r,g), None):
+                    self._add_constraint(
+                        model,
+                        pulp.LpAffineExpression([
+                            term for n in self.nodes_of_group.get(g, ()) for term in net_terms[n]
+                        ]),
+                        pulp.LpConstraintEQ,
+                        f"initial_resources_assigned_{r}_{t}_{g}",
+                        initial_count[('@',r,g)]
                     )
-                )
-                model += (expr, f"initial_resources_assigned_{r}_{t}_{g}")
 
-        # Total resource constraint
-        for r, t in product(
-            self.network_sets['RESOURCES'], 
-            self.network_sets['PERIODS']
-        ):
-            if int(t) == 1 and self.parameters['resource_node_initial_count'].get(('@',r,'@'), None):
-                expr = (
-                    pulp.lpSum(self.variables['resources_assigned'][r,n,t] * 
-                            self.parameters['node_in_nodegroup'].get((n,g), 0) 
-                            for n in self.network_sets['NODES'] 
-                            for g in self.network_sets['NODEGROUPS']) == 
-                    self.parameters['resource_node_initial_count'].get(('@',r,'@'), 0) + 
-                    pulp.lpSum(
-                        self.variables['resources_added'][r,n,t] * 
-                        self.parameters['node_in_nodegroup'].get((n,g), 0) - 
-                        self.variables['resources_removed'][r,n,t] * 
-                        self.parameters['node_in_nodegroup'].get((n,g), 0) 
-                        for n in self.network_sets['NODES'] 
-                        for g in self.network_sets['NODEGROUPS']
-                    )
+            # Total resource constraint
+            if initial_count.get(('@',r,'@'), None):
+                self._add_constraint(
+                    model,
+                    pulp.LpAffineExpression(total_terms),
+                    pulp.LpConstraintEQ,
+                    f"initial_resources_assigned_{r}_{t}",
+                    initial_count[('@',r,'@')]
                 )
-                model += (expr, f"initial_resources_assigned_{r}_{t}")
 
     def _build_resource_capacity_constraints(self, model: pulp.LpProblem) -> None:
         """Build constraints related to resource capacity"""
-        resource_capacity_by_type_sum = {}
+        # Capacity demand by type does not depend on the resource, so compute it once
+        # and visit only the (period, node, group, type) cells that have demand
+        capacity_demand = self._get_capacity_demand()
+        periods = list(self.network_sets['PERIODS'])
+        nodes = list(self.network_sets['NODES'])
+        nodegroups = list(self.network_sets['NODEGROUPS'])
+        capacity_types = list(self.network_sets['RESOURCE_CAPACITY_TYPES'])
+        resource_capacity = self.variables['resource_capacity']
+        resources_assigned = self.variables['resources_assigned']
+        capacity_by_type = self.parameters['resource_capacity_by_type']
         
         # Capacity calculation by type
-        for r, t, n, c, g in product(
-            self.network_sets['RESOURCES'], 
-            self.network_sets['PERIODS'],
-            self.network_sets['NODES'],
-            self.network_sets['RESOURCE_CAPACITY_TYPES'],
-            self.network_sets['NODEGROUPS']
-        ):
-            # Calculate capacity demand
-            if self.parameters['node_in_nodegroup'].get((n,g), 0) == 1:
-                if c in self.network_sets['RESOURCE_PARENT_CAPACITY_TYPES']:
-                    capacity_demand = sum(
-                        self.parameters['resource_capacity_consumption'].get((p, t, g, n, c2), 0) * 
-                        self.parameters['capacity_type_hierarchy'].get((c2, c), 0) 
-                        for p in self.network_sets['PRODUCTS'] 
-                        for c2 in self.network_sets['RESOURCE_CAPACITY_TYPES']
-                    )
-                else:
-                    capacity_demand = sum(
-                        self.parameters['resource_capacity_consumption'].get((p, t, g, n, c), 0) 
-                        for p in self.network_sets['PRODUCTS']
-                    )
-                
-                # Add capacity constraint if demand exists and capacity is defined
-                if (capacity_demand > 0 and 
-                    self.parameters['resource_capacity_by_type'].get((t, n, r, c, g), None) is not None):
-                    resource_capacity_by_type_sum[(t,n,c,g)] = resource_capacity_by_type_sum.get((t,n,c,g), 0) + self.parameters['resource_capacity_by_type'].get((t,n,r,c,g),0)
-                    expr = (
-                        self.variables['resource_capacity'][r, n, t, c] <= 
-                        self.variables['resources_assigned'][r, n, t] * 
-                        self.parameters['resource_capacity_by_type'].get((t, n, r, c, g), 0)
-                    )
-                    model += (expr, f"capacity_based_on_resources_assigned_{r}_{t}_{n}_{c}_{g}")
+        for t_i, n_i, g_i, c_i in np.argwhere(capacity_demand > 0):
+            t, n, g, c = periods[t_i], nodes[n_i], nodegroups[g_i], capacity_types[c_i]
+            if g not in self.groups_of_node.get(n, ()):
+                continue
+            for r in self.network_sets['RESOURCES']:
+                # Add capacity constraint if capacity is defined
+                capacity = capacity_by_type.get((t, n, r, c, g), None)
+                if capacity is None:
+                    continue
+                if capacity == 0:
+                    resource_capacity[r, n, t, c].upBound = 0
+                    continue
+                self._leq(
+                    model,
+                    resource_capacity[r, n, t, c],
+                    resources_assigned[r, n, t] * capacity,
+                    f"capacity_based_on_resources_assigned_{r}_{t}_{n}_{c}_{g}"
+                )
+
+    def _get_capacity_demand(self) -> np.ndarray:
+        """Capacity demand summed over products, indexed [period, node, node group, capacity type]
+        
+        Parent capacity types roll up the demand of their children through
+        capacity_type_hierarchy.
+        """
+        t_idx = {t: i for i, t in enumerate(self.network_sets['PERIODS'])}
+        n_idx = {n: i for i, n in enumerate(self.network_sets['NODES'])}
+        g_idx = {g: i for i, g in enumerate(self.network_sets['NODEGROUPS'])}
+        c_idx = {c: i for i, c in enumerate(self.network_sets['RESOURCE_CAPACITY_TYPES'])}
+        products = set(self.network_sets['PRODUCTS'])
+
+        consumption = np.zeros((len(t_idx), len(n_idx), len(g_idx), len(c_idx)))
+        for (p, t, g, n, c), value in self.parameters['resource_capacity_consumption'].items():
+            if p in products and t in t_idx and n in n_idx and g in g_idx and c in c_idx:
+                consumption[t_idx[t], n_idx[n], g_idx[g], c_idx[c]] += value
+
+        hierarchy = np.zeros((len(c_idx), len(c_idx)))
+        for (c2, c), value in self.parameters['capacity_type_hierarchy'].items():
+            if c2 in c_idx and c in c_idx:
+                hierarchy[c_idx[c2], c_idx[c]] = value
+
+        is_parent = np.array([c in self.network_sets['RESOURCE_PARENT_CAPACITY_TYPES'] for c in c_idx], dtype=bool)
+        return np.where(is_parent, consumption @ hierarchy, consumption)
 
     def _build_resource_attribute_constraints(self, model: pulp.LpProblem) -> None:
         """Constraints for resource attribute consumption"""
+        resource_attribute_consumption = self.variables['resource_attribute_consumption']
+        resources_assigned = self.variables['resources_assigned']
+        consumption_per = self.parameters['resource_attribute_consumption_per']
         for r, t, n, a in product(
             self.network_sets['RESOURCES'], 
             self.network_sets['PERIODS'], 
             self.network_sets['NODES'], 
             self.network_sets['RESOURCE_ATTRIBUTES']
         ):
-            if self.parameters['resource_attribute_consumption_per'].get((t, r, a), 0) != 0:
-                expr = (
-                    self.variables['resource_attribute_consumption'][r, t, n, a] == 
-                    self.variables['resources_assigned'][r, n, t] * 
-                    self.parameters['resource_attribute_consumption_per'].get((t, r, a), 0)
-                )
-                model += (expr, f"resource_attribute_consumption_{r}_{t}_{n}_{a}")
-
-    def _build_resource_binary_constraints(self, model: pulp.LpProblem) -> None:
-        """Constraints for binary variables related to resource addition/removal"""
-        for r, n, t in product(
-            self.network_sets['RESOURCES'], 
-            self.network_sets['NODES'], 
-            self.network_sets['PERIODS']
-        ):
-            # Bounds for resources added
-            expr1 = (
-                self.variables['resources_added'][r, n, t] <= 
-                self.variables['resources_added_binary'][r, n, t] * 
-                self.big_m
-            )
-            model += (expr1, f"resource_added_binary_lb_{r}_{t}_{n}")
-            
-            expr2 = (
-                self.variables['resources_added'][r, n, t] >= 
-                self.variables['resources_added_binary'][r, n, t]
-            )
-            model += (expr2, f"resource_added_binary_ub_{r}_{t}_{n}")
-            
-            # Bounds for resources removed
-            expr3 = (
-                self.variables['resources_removed'][r, n, t] <= 
-                self.variables['resources_removed_binary'][r, n, t] * 
-                self.big_m
-            )
-            model += (expr3, f"resource_removed_binary_lb_{r}_{t}_{n}")
-            
-            expr4 = (
-                self.variables['resources_removed'][r, n, t] >= 
-                self.variables['resources_removed_binary'][r, n, t]
-            )
-            model += (expr4, f"resource_removed_binary_ub_{r}_{t}_{n}")
-
-        # Cohort-based constraints for resource addition and removal
-        for r, n, t, g in product(
-            self.network_sets['RESOURCES'], 
-            self.network_sets['NODES'], 
-            self.network_sets['PERIODS'], 
-            self.network_sets['NODEGROUPS']
-        ):
-            if self.parameters['node_in_nodegroup'].get((n, g), 0) == 1:
-                # Resource addition constraints
-                expr1 = (
-                    self.variables['resources_added'][r, n, t] >= 
-                    self.variables['resource_cohorts_added'][r, n, t] * 
-                    self.parameters['resource_add_cohort_count'].get((t, n, r, g), 1)
-                )
-                model += (expr1, f"resources_added_{r}_{t}_{n}_{g}")
-                
-                # Resource removal constraints
-                expr2 = (
-                    self.variables['resources_removed'][r, n, t] >= 
-                    self.variables['resource_cohorts_removed'][r, n, t] * 
-                    self.parameters['resource_remove_cohort_count'].get((t, n, r, g), 1)
+            consumption = consumption_per.get((t, r, a), 0)
+            if consumption != 0:
+                self._eq(
+                    model,
+                    resource_attribute_consumption[r, t, n, a],
+                    resources_assigned[r, n, t] * consumption,
+                    f"resource_attribute_consumption_{r}_{t}_{n}_{a}"
                 )
-                model += (expr2, f"resources_removed_{r}_{t}_{n}_{g}")
 
     def _build_resource_cost_constraints(self, model: pulp.LpProblem) -> None:
         """Constraints for resource-related costs"""
-        for r, n, t, g in product(
-            self.network_sets['RESOURCES'], 
-            self.network_sets['NODES'], 
+        # Grand total resource cost
+        resource_add_cost = self.variables['resource_add_cost']
+        resource_remove_cost = self.variables['resource_remove_cost']
+        resource_time_cost = self.variables['resource_time_cost']
+        terms = [(self.variables['resource_grand_total_cost'], 1)]
+        for t, n, r in product(
             self.network_sets['PERIODS'], 
-            self.network_sets['NODEGROUPS']
+            self.network_sets['NODES'], 
+            self.network_sets['RESOURCES']
         ):
-            if self.parameters['node_in_nodegroup'].get((n, g), 0) == 1:
-                # Resource addition cost
-                expr1 = (
-                    self.variables['resource_add_cost'][t, n, r] == 
-                    self.variables['resource_cohorts_added'][r, n, t] * 
-                    self.parameters['resource_add_cohort_count'].get((t, n, r, g), 1) * 
-                    self.parameters['resource_fixed_add_cost'].get((t, n, r, g), 0)
-                )
-                model += (expr1, f"resources_added_cost_{r}_{t}_{n}_{g}")
-                
-                # Resource removal cost
-                expr2 = (
-                    self.variables['resource_remove_cost'][t, n, r] == 
-                    self.variables['resource_cohorts_removed'][r, n, t] * 
-                    self.parameters['resource_remove_cohort_count'].get((t, n, r, g), 1) * 
-                    self.parameters['resource_fixed_remove_cost'].get((t, n, r, g), 0)
-                )
-                model += (expr2, f"resources_removed_cost_{r}_{t}_{n}_{g}")
-                
-                # Resource time-based cost
-                expr3 = (
-                    self.variables['resource_time_cost'][t, n, r] >= 
-                    self.variables['resources_assigned'][r, n, t] * 
-                    self.parameters['resource_cost_per_time'].get((t, n, r, g), 0)
-                )
-                model += (expr3, f"resources_time_cost_{r}_{t}_{n}_{g}")
-
-        # Grand total resource cost
-        expr = (
-            self.variables['resource_grand_total_cost'] == 
-            pulp.lpSum(
-                self.variables['resource_add_cost'][t, n, r] + 
-                self.variables['resource_remove_cost'][t, n, r] + 
-                self.variables['resource_time_cost'][t, n, r] 
-                for t, n, r in product(
-                    self.network_sets['PERIODS'], 
-                    self.network_sets['NODES'], 
-                    self.network_sets['RESOURCES']
-                )
-            )
-        )
-        model += (expr, "resources_grand_total_cost")
+            key = (t, n, r)
+            terms.append((resource_add_cost[key], -1))
+            terms.append((resource_remove_cost[key], -1))
+            terms.append((resource_time_cost[key], -1))
+        self._add_constraint(model, pulp.LpAffineExpression(terms), pulp.LpConstraintEQ, "resources_grand_total_cost")
 
     def _build_resource_attribute_limits_constraints(self, model: pulp.LpProblem) -> None:
         """Build constraints for resource attribute limits"""
@@ -284,199 +324,231 @@ class ResourceConstraints(BaseConstraint):
 
         if (self.parameters.get('resource_attribute_min') or 
             self.parameters.get('resource_attribute_max')):
+            resources_added = self.variables['resources_added']
+            resources_removed = self.variables['resources_removed']
+            resources_assigned = self.variables['resources_assigned']
+            # Nonzero attribute consumption by (period, resource), per attribute and over all attributes
+            consumption_by_attribute = {a: {} for a in self.network_sets['RESOURCE_ATTRIBUTES']}
+            for (t, r, a), value in self.parameters['resource_attribute_consumption_per'].items():
+                if value != 0 and a in consumption_by_attribute:
+                    consumption_by_attribute[a][t, r] = value
+            total_consumption = {}
+            for a in self.network_sets['RESOURCE_ATTRIBUTES']:
+                for key, value in consumption_by_attribute[a].items():
+                    total_consumption[key] = total_consumption.get(key, 0) + value
+            consumption_by_attribute['@'] = {
+                key: value for key, value in total_consumption.items() if value != 0
+            }
             
             for n_index in nodes:
-                for g_index in nodegroups:
-                    if n_index == '@' or self.parameters['node_in_nodegroup'].get((n_index, g_index), 0) == 1:
-                        nodes_list = self.network_sets['NODES'] if n_index == '@' else [n_index]
+                # The node group only selects which limits apply; the aggregates are
+                # the same for every group of the node, so build them once
+                if n_index == '@':
+                    nodes_list = self.network_sets['NODES']
+                    groups_list = nodegroups
+                else:
+                    nodes_list = [n_index]
+                    groups_list = self.groups_of_node.get(n_index, ())
+                if not groups_list:
+                    continue
+                
+                for t_index in periods:
+                    periods_list = self.network_sets['PERIODS'] if t_index == '@' else [t_index]
+                    
+                    for r_index in resources:
+                        resources_list = self.network_sets['RESOURCES'] if r_index == '@' else [r_index]
                         
-                        for t_index in periods:
-                            periods_list = self.network_sets['PERIODS'] if t_index == '@' else [t_index]
-                            
-                            for r_index in resources:
-                                resources_list = self.network_sets['RESOURCES'] if r_index == '@' else [r_index]
-                                
-                                # Resource addition min/max constraints
-                                min_add_expr = (
-                                    self.parameters['resource_min_to_add'].get((t_index, n_index, r_index, g_index), 0) <= 
-                                    pulp.lpSum(
-                                        self.variables['resources_added'][r,n,t]
-                                        for n in nodes_list
-                                        for r in resources_list
-                                        for t in periods_list
-                                    )
-                                )
-                                model += (min_add_expr, f"resources_added_min_{t_index}_{n_index}_{r_index}_{g_index}")
-                                
-                                max_add_expr = (
-                                    self.parameters['resource_max_to_add'].get(
-                                        (t_index, n_index, r_index, g_index),
-                                        self.big_m
-                                    ) >= pulp.lpSum(
-                                        self.variables['resources_added'][r,n,t]
-                                        for n in nodes_list
-                                        for r in resources_list
-                                        for t in periods_list
-                                    )
+                        keys = [
+                            (r, n, t)
+                            for n in nodes_list
+                            for r in resources_list
+                            for t in periods_list
+                        ]
+                        added = pulp.LpAffineExpression([(resources_added[k], 1) for k in keys])
+                        removed = pulp.LpAffineExpression([(resources_removed[k], 1) for k in keys])
+                        assigned = pulp.LpAffineExpression([(resources_assigned[k], 1) for k in keys])
+
+                        for g_index in groups_list:
+                            # Resource addition min/max constraints (the variables are nonnegative,
+                            # so a minimum of zero or less holds for every solution)
+                            minimum = self.parameters['resource_min_to_add'].get((t_index, n_index, r_index, g_index), 0)
+                            if minimum > 0:
+                                self._leq(
+                                    model,
+                                    minimum,
+                                    added,
+                                    f"resources_added_min_{t_index}_{n_index}_{r_index}_{g_index}"
                                 )
-                                model += (max_add_expr, f"resource_added_max_{t_index}_{n_index}_{r_index}_{g_index}")
+                            
+                            self._geq(
+                                model,
+                                self.parameters['resource_max_to_add'].get(
+                                    (t_index, n_index, r_index, g_index),
+                                    self.big_m
+                                ),
+                                added,
+                                f"resource_added_max_{t_index}_{n_index}_{r_index}_{g_index}"
+                            )
 
-                                # Resource removal min/max constraints
-                                min_remove_expr = (
-                                    self.parameters['resource_min_to_remove'].get((t_index, n_index, r_index, g_index), 0) <= 
-                                    pulp.lpSum(
-                                        self.variables['resources_removed'][r,n,t]
-                                        for n in nodes_list
-                                        for r in resources_list
-                                        for t in periods_list
-                                    )
+                            # Resource removal min/max constraints
+                            minimum = self.parameters['resource_min_to_remove'].get((t_index, n_index, r_index, g_index), 0)
+                            if minimum > 0:
+                                self._leq(
+                                    model,
+                                    minimum,
+                                    removed,
+                                    f"resources_removed_min_{t_index}_{n_index}_{r_index}_{g_index}"
                                 )
-                                model += (min_remove_expr, f"resources_removed_min_{t_index}_{n_index}_{r_index}_{g_index}")
-                                
-                                max_remove_expr = (
-                                    self.parameters['resource_max_to_remove'].get(
-                                        (t_index, n_index, r_index, g_index),
-                                        self.big_m
-                                    ) >= pulp.lpSum(
-                                        self.variables['resources_removed'][r,n,t]
-                                        for n in nodes_list
-                                        for r in resources_list
-                                        for t in periods_list
-                                    )
+                            
+                            self._geq(
+                                model,
+                                self.parameters['resource_max_to_remove'].get(
+                                    (t_index, n_index, r_index, g_index),
+                                    self.big_m
+                                ),
+                                removed,
+                                f"resource_removed_max_{t_index}_{n_index}_{r_index}_{g_index}"
+                            )
+
+                            # Total resource count min/max constraints
+                            minimum = self.parameters['resource_node_min_count'].get((t_index, n_index, r_index, g_index), 0)
+                            if minimum > 0:
+                                self._leq(
+                                    model,
+                                    minimum,
+                                    assigned,
+                                    f"resources_total_min_{t_index}_{n_index}_{r_index}_{g_index}"
                                 )
-                                model += (max_remove_expr, f"resource_removed_max_{t_index}_{n_index}_{r_index}_{g_index}")
+                            
+                            self._geq(
+                                model,
+                                self.parameters['resource_node_max_count'].get(
+                                    (t_index, n_index, r_index, g_index),
+                                    self.big_m
+                                ),
+                                assigned,
+                                f"resources_total_max_{t_index}_{n_index}_{r_index}_{g_index}"
+                            )
 
-                                # Total resource count min/max constraints
-                                min_total_expr = (
-                                    self.parameters['resource_node_min_count'].get((t_index, n_index, r_index, g_index), 0) <= 
-                                    pulp.lpSum(
-                                        self.variables['resources_assigned'][r,n,t]
-                                        for n in nodes_list
-                                        for r in resources_list
-                                        for t in periods_list
-                                    )
+                        # Resource attribute min/max constraints
+                        for a_index in resourceattributes:
+                            consumption = consumption_by_attribute[a_index]
+                            terms = [
+                                (resources_assigned[r, n, t], consumption[t, r])
+                                for r, n, t in keys
+                                if (t, r) in consumption
+                            ]
+                            attribute_use = pulp.LpAffineExpression(terms)
+                            nonnegative_use = all(consumption > 0 for _, consumption in terms)
+
+                            for g_index in groups_list:
+                                minimum = self.parameters['resource_attribute_min'].get(
+                                    (t_index, n_index, r_index, g_index, a_index), 0
                                 )
-                                model += (min_total_expr, f"resources_total_min_{t_index}_{n_index}_{r_index}_{g_index}")
+                                if minimum > 0 or not nonnegative_use:
+                                    self._leq(
+                                        model,
+                                        minimum,
+                                        attribute_use,
+                                        f"resource_attribute_min_constraint_{t_index}_{n_index}_{a_index}_{r_index}_{g_index}"
+                                    )
                                 
-                                max_total_expr = (
-                                    self.parameters['resource_node_max_count'].get(
-                                        (t_index, n_index, r_index, g_index),
+                                self._geq(
+                                    model,
+                                    self.parameters['resource_attribute_max'].get(
+                                        (t_index, n_index, r_index, g_index, a_index),
                                         self.big_m
-                                    ) >= pulp.lpSum(
-                                        self.variables['resources_assigned'][r,n,t]
-                                        for n in nodes_list
-                                        for r in resources_list
-                                        for t in periods_list
-                                    )
+                                    ),
+                                    attribute_use,
+                                    f"resource_attribute_max_constraint_{t_index}_{n_index}_{a_index}_{r_index}_{g_index}"
                                 )
-                                model += (max_total_expr, f"resources_total_max_{t_index}_{n_index}_{r_index}_{g_index}")
-
-                                # Resource attribute min/max constraints
-                                for a_index in resourceattributes:
-                                    resource_attributes_list = (
-                                        self.network_sets['RESOURCE_ATTRIBUTES'] 
-                                        if a_index == '@' else [a_index]
-                                    )
-                                    
-                                    min_attr_expr = (
-                                        self.parameters['resource_attribute_min'].get(
-                                            (t_index, n_index, r_index, g_index, a_index), 0
-                                        ) <= pulp.lpSum(
-                                            self.variables['resources_assigned'][r,n,t] * 
-                                            self.parameters['resource_attribute_consumption_per'].get((t,r,a), 0)
-                                            for n in nodes_list
-                                            for r in resources_list
-                                            for t in periods_list
-                                            for a in resource_attributes_list
-                                        )
-                                    )
-                                    model += (min_attr_expr, f"resource_attribute_min_constraint_{t_index}_{n_index}_{a_index}_{r_index}_{g_index}")
-                                    
-                                    max_attr_expr = (
-                                        self.parameters['resource_attribute_max'].get(
-                                            (t_index, n_index, r_index, g_index, a_index),
-                                            self.big_m
-                                        ) >= pulp.lpSum(
-                                            self.variables['resources_assigned'][r,n,t] * 
-                                            self.parameters['resource_attribute_consumption_per'].get((t,r,a), 0)
-                                            for n in nodes_list
-                                            for r in resources_list
-                                            for t in periods_list
-                                            for a in resource_attributes_list
-                                        )
-                                    )
-                                    model += (max_attr_expr, f"resource_attribute_max_constraint_{t_index}_{n_index}_{a_index}_{r_index}_{g_index}")
 
     def _build_resource_utilization_constraints(self, model: pulp.LpProblem) -> None:
         """Build constraints for resource utilization tracking"""
         if self.parameters.get('resource_capacity_consumption'):
-            for r, n, t, c, g in product(
-                self.network_sets['RESOURCES'],
+            processed_product = self.variables['processed_product']
+            node_utilization = self.variables['node_utilization']
+            capacity_by_type = self.parameters['resource_capacity_by_type']
+            initial_count = self.parameters['resource_node_initial_count']
+            consumption = self.parameters['resource_capacity_consumption']
+            # Products with nonzero consumption in each (period, group, node, type) cell
+            products = set(self.network_sets['PRODUCTS'])
+            consumption_by_cell = {}
+            for (p, t, g, n, c), value in consumption.items():
+                if value != 0 and p in products:
+                    consumption_by_cell.setdefault((t, g, n, c), []).append((p, value))
+            consumption_windows = self._get_window_periods({
+                ((n, p, g), t2): window
+                for (t2, n, p, g), window in self.parameters['capacity_consumption_periods'].items()
+            })
+            for n, t, c in product(
                 self.network_sets['NODES'],
                 self.network_sets['PERIODS'],
-                self.network_sets['RESOURCE_CHILD_CAPACITY_TYPES'],
-                self.network_sets['NODEGROUPS']
+                self.network_sets['RESOURCE_CHILD_CAPACITY_TYPES']
             ):
-                if (self.parameters['node_in_nodegroup'].get((n,g),0) == 1 and 
-                    self.parameters['resource_capacity_by_type'].get((t,n,r,c,g)) is not None):
+                for g in self.groups_of_node.get(n, ()):
+                    initial_capacities = [
+                        capacity_by_type[t,n,r,c,g] * initial_count.get((n,r,g), 0)
+                        for r in self.network_sets['RESOURCES']
+                        if capacity_by_type.get((t,n,r,c,g)) is not None
+                    ]
+                    if not initial_capacities:
+                        continue
                     
-                    initial_capacity = (
-                        self.parameters['resource_capacity_by_type'].get((t,n,r,c,g), 1) * 
-                        self.parameters['resource_node_initial_count'].get((n,r,g), 0)
-                    )
+                    # Each resource bounds utilization by the (nonnegative) consumption over its
+                    # initial capacity, so the largest capacity is the binding one, unless a
+                    # resource without initial capacity pins utilization to zero
+                    if min(initial_capacities) > 0:
+                        initial_capacity = max(initial_capacities)
+                    else:
+                        initial_capacity = 0
                     
                     # Child capacity types
                     if c in self.network_sets['RESOURCE_CHILD_CAPACITY_TYPES']:
                         if initial_capacity > 0:
-                            expr = (
-                                self.variables['node_utilization'][n,t,c] <= (
-                                    pulp.lpSum(
-                                        self.variables['processed_product'][n,p,t] * 
-                                        self.parameters['resource_capacity_consumption'].get((p,t,g,n,c), 0) 
-                                        for p in self.network_sets['PRODUCTS']
-                                    ) +
-                                    pulp.lpSum(
-                                        self.variables['processed_product'][n,p,t2] * 
-                                        self.parameters['resource_capacity_consumption'].get((p,t2,g,n,c), 0)
-                                        for t2, p in product(
-                                            self.network_sets['PERIODS'],
-                                            self.network_sets['PRODUCTS']
-                                        )
-                                        if int(t2) >= int(t) - int(self.parameters['capacity_consumption_periods'].get((t2,n,p,g), 0))
-                                        and int(t2) < int(t)
-                                    )
-                                ) / initial_capacity
+                            terms = [
+                                (processed_product[n,p,t], value)
+                                for p, value in consumption_by_cell.get((t,g,n,c), ())
+                            ]
+                            terms += [
+                                (processed_product[n,p,t2], consumption.get((p,t2,g,n,c), 0))
+                                for p in self.network_sets['PRODUCTS']
+                                for t2 in consumption_windows.get(((n,p,g), t), ())
+                            ]
+                            # Scale utilization up by the capacity rather than divide every consumption term
+                            self._add_constraint(
+                                model,
+                                pulp.LpAffineExpression(
+                                    [(node_utilization[n,t,c], initial_capacity)] + 
+                                    [(var, -value) for var, value in terms if value != 0]
+                                ),
+                                pulp.LpConstraintLE,
+                                f"Utilization_constraint_{n}_{t}_{c}_{g}"
                             )
                         else:
-                            expr = (self.variables['node_utilization'][n,t,c] == 0)
-                        model += (expr, f"Utilization_constraint_{r}_{n}_{t}_{c}_{g}")
+                            self._eq(model, node_utilization[n,t,c], 0, f"Utilization_constraint_{n}_{t}_{c}_{g}")
 
                     # Parent capacity types
                     if c in self.network_sets['RESOURCE_PARENT_CAPACITY_TYPES']:
                         if initial_capacity > 0:
-                            expr = (
-                                self.variables['node_utilization'][n,t,c] <= (
-                                    pulp.lpSum(
-                                        self.variables['processed_product'][n,p,t] * 
-                                        self.parameters['resource_capacity_consumption'].get((p,t,g,n,c2), 0) * 
-                                        self.parameters['capacity_type_hierarchy'].get((c2,c), 0)
-                                        for p in self.network_sets['PRODUCTS']
-                                        for c2 in self.network_sets['RESOURCE_CHILD_CAPACITY_TYPES']
-                                    ) +
-                                    pulp.lpSum(
-                                        self.variables['processed_product'][n,p,t2] * 
-                                        self.parameters['resource_capacity_consumption'].get((p,t2,g,n,c2), 0) * 
-                                        self.parameters['capacity_type_hierarchy'].get((c2,c), 0)
-                                        for t2, p, c2 in product(
-                                            self.network_sets['PERIODS'],
-                                            self.network_sets['PRODUCTS'],
-                                            self.network_sets['RESOURCE_CHILD_CAPACITY_TYPES']
-                                        )
-                                        if int(t2) >= int(t) - int(self.parameters['capacity_consumption_periods'].get((t2,n,p,g), 0))
-                                        and int(t2) < int(t)
-                                    )
-                                ) / initial_capacity
+                            # Roll child consumption up to this type once per product and period
+                            terms = [
+                                (processed_product[n,p,t2], sum(
+                                    consumption.get((p,t2,g,n,c2), 0) * 
+                                    self.parameters['capacity_type_hierarchy'].get((c2,c), 0)
+                                    for c2 in self.network_sets['RESOURCE_CHILD_CAPACITY_TYPES']
+                                ))
+                                for p in self.network_sets['PRODUCTS']
+                                for t2 in [t, *consumption_windows.get(((n,p,g), t), ())]
+                            ]
+                            self._add_constraint(
+                                model,
+                                pulp.LpAffineExpression(
+                                    [(node_utilization[n,t,c], initial_capacity)] + 
+                                    [(var, -value) for var, value in terms if value != 0]
+                                ),
+                                pulp.LpConstraintLE,
+                                f"Utilization_constraint_{n}_{t}_{c}_{g}"
                             )
                         else:
-                            expr = (self.variables['node_utilization'][n,t,c] == 0)
-                        model += (expr, f"Utilization_constraint_{r}_{n}_{t}_{c}_{g}")
\ No newline at end of file
+                            self._eq(model, node_utilization[n,t,c], 0, f"Utilization_constraint_{n}_{t}_{c}_{g}")
@@ -1,8 +1,19 @@
 from itertools import product
+from typing import Dict, Any
 import pulp
 from .base_constraint import BaseConstraint
 
 class TransportationConstraints(BaseConstraint):
+    def __init__(self, variables: Dict[str, Any], network_sets: Dict[str, Any], parameters: Dict[str, Any]):
+        super().__init__(variables, network_sets, parameters)
+
+        # Every (origin, destination) lane, and the node group pairs each lane belongs to
+        self.lanes = tuple(product(network_sets['DEPARTING_NODES'], network_sets['RECEIVING_NODES']))
+        self.lane_group_pairs = {
+            (o, d): tuple(product(self.groups_of_node.get(o, ()), self.groups_of_node.get(d, ())))
+            for o, d in self.lanes
+        }
+
     def build(self, model: pulp.LpProblem) -> None:
         self._build_total_cost_constraints(model)
         self._build_max_transit_distance_constraints(model)
@@ -13,51 +24,121 @@ class TransportationConstraints(BaseConstraint):
         self._build_transportation_capacity_option_constraints(model)
         self._build_distance_time_constraints(model)
     
+    def _get_largest_group_pair_cost(self, costs) -> tuple:
+        """Return the (cost, g, g2) with the largest cost, the first pair on ties
+
+        Cost rows of different node group pairs share their variables, which are
+        all nonnegative, so the row with the largest coefficient implies the rest.
+        Returns a zero cost when the lane has no node group pairs.
+        """
+        best = (0, None, None)
+        for cost in costs:
+            if best[1] is None or cost[0] > best[0]:
+                best = cost
+        return best
+
     def _build_max_transit_distance_constraints(self, model: pulp.LpProblem) -> None:
-        for o, t, d, p, m in product(
+        # The assignment is binary, so of the per-mode rows only the one for the longest
+        # lane can bind (a lane without a distance counts as big_m)
+        distance = self.parameters['distance']
+        big_m = self.big_m
+        modes = self.network_sets['MODES']
+        longest_lanes = {}
+        for o, d in self.lanes:
+            if modes:
+                mode_distances = {m: distance.get((o, d, m), big_m) for m in modes}
+                m = max(mode_distances, key=mode_distances.get)
+                lane_distance = mode_distances[m]
+                # max_transit_distance is nonnegative, so a lane of length zero or less never binds
+                if lane_distance > 0:
+                    longest_lanes[o, d] = (m, lane_distance)
+
+        max_transit_distance = self.variables['max_transit_distance']
+        assignment = self.variables['binary_product_destination_assignment']
+        for o, t, d in product(
             self.network_sets['DEPARTING_NODES'],
             self.network_sets['PERIODS'],
-            self.network_sets['RECEIVING_NODES'],
-            self.network_sets['PRODUCTS'],
-            self.network_sets['MODES']
+            self.network_sets['RECEIVING_NODES']
         ):
-            expr = (
-                self.variables['max_transit_distance'] >= 
-                self.variables['binary_product_destination_assignment'][o, t, p, d] * 
-                self.parameters['distance'].get((o, d, m), self.big_m)
-            )
-            model += (expr, f"max_transit_distance_constraint_{o}_{t}_{d}_{p}_{m}")
+            if (o, d) not in longest_lanes:
+                continue
+            m, lane_distance = longest_lanes[o, d]
+            for p in self.network_sets['PRODUCTS']:
+                self._add_constraint(
+                    model,
+                    pulp.LpAffineExpression([(max_transit_distance, 1), (assignment[o, t, p, d], -lane_distance)]),
+                    pulp.LpConstraintGE,
+                    f"max_transit_distance_constraint_{o}_{t}_{d}_{p}_{m}"
+                )
     
     def _build_num_loads_constraints(self, model: pulp.LpProblem) -> None:
-        # Number of loads by group constraint
-        for o, d, t, m, u, tg, g, g2 in product(
-            self.network_sets['DEPARTING_NODES'],
-            self.network_sets['RECEIVING_NODES'],
-            self.network_sets['PERIODS'],
-            self.network_sets['MODES'],
-            self.network_sets['MEASURES'],
-            self.network_sets['TRANSPORTATION_GROUPS'],
-            self.network_sets['NODEGROUPS'],
-            self.network_sets['NODEGROUPS']
-        ):
-            if self.parameters['node_in_nodegroup'].get((o,g),0)==1 and self.parameters['node_in_nodegroup'].get((d,g2),0)==1:
-                expr = (self.variables['num_loads_by_group'][o,d,t,m,tg] >= 
-                    (pulp.lpSum(self.variables['departed_measures'][o,d,p,t,m,u] * 
-                    self.parameters['transportation_group'].get((p,tg),0) for p in self.network_sets['PRODUCTS']) / 
-                    self.parameters['load_capacity'].get((t,o,d,m,u,g,g2), self.big_m)))
-                model += (expr, f"num_loads_by_group_{o}_{d}_{t}_{m}_{u}_{tg}_{g}_{g2}")
-
-        # Total number of loads constraints
+        transportation_groups = tuple(self.network_sets['TRANSPORTATION_GROUPS'])
+        measure_groups = tuple(product(self.network_sets['MEASURES'], transportation_groups))
+
+        # Products with a nonzero share in each transportation group, in PRODUCTS order
+        transportation_group = self.parameters['transportation_group']
+        products_of_group = {
+            tg: [
+                (p, transportation_group[p,tg])
+                for p in self.network_sets['PRODUCTS']
+                if transportation_group.get((p,tg),0) != 0
+            ]
+            for tg in transportation_groups
+        }
+        departed_measures = self.variables['departed_measures']
+        load_capacities = self.parameters['load_capacity']
+        big_m = self.big_m
+        lanes = self.lanes
+        group_pairs = self.lane_group_pairs
+
+        num_loads = self.variables['num_loads']
+        num_loads_by_group = self.variables['num_loads_by_group']
+        od_terms = {}
+        mode_terms = {
+            (m, t): []
+            for m, t in product(self.network_sets['MODES'], self.network_sets['PERIODS'])
+        }
+
+        # Number of loads by group and total number of loads, in one pass over (o, d, t, m)
         for o, d, t, m in product(
             self.network_sets['DEPARTING_NODES'],
             self.network_sets['RECEIVING_NODES'],
             self.network_sets['PERIODS'],
             self.network_sets['MODES']
         ):
-            expr = (self.variables['num_loads'][o,d,t,m] == 
-                   pulp.lpSum(self.variables['num_loads_by_group'][o,d,t,m,g] 
-                            for g in self.network_sets['TRANSPORTATION_GROUPS']))
-            model += (expr, f"od_num_loads_{o}_{d}_{t}_{m}")
+            for u, tg in measure_groups:
+                # Without any product in the group the row reduces to the variable's zero lower bound
+                if not products_of_group[tg]:
+                    continue
+                measures = [
+                    (departed_measures[o,d,p,t,m,u], share)
+                    for p, share in products_of_group[tg]
+                ]
+                for g, g2 in group_pairs[o, d]:
+                    load_capacity = load_capacities.get((t,o,d,m,u,g,g2), big_m)
+                    self._geq(
+                        model,
+                        num_loads_by_group[o,d,t,m,tg],
+                        pulp.LpAffineExpression(
+                            (var, share / load_capacity) for var, share in measures
+                        ),
+                        f"num_loads_by_group_{o}_{d}_{t}_{m}_{u}_{tg}_{g}_{g2}"
+                    )
+
+            self._eq(
+                model,
+                num_loads[o,d,t,m],
+                pulp.LpAffineExpression(
+                    (num_loads_by_group[o,d,t,m,g], 1)
+                    for g in transportation_groups
+                ),
+                f"od_num_loads_{o}_{d}_{t}_{m}"
+            )
+
+            weight = self.period_weight[t]
+            if weight != 0:
+                od_terms.setdefault((o, d, t), []).append((num_loads[o,d,t,m], weight))
+                mode_terms[m, t].append((num_loads[o,d,t,m], weight))
 
         # OD number of loads constraints
         for o, d, t in product(
@@ -65,219 +146,328 @@ class TransportationConstraints(BaseConstraint):
             self.network_sets['RECEIVING_NODES'],
             self.network_sets['PERIODS']
         ):
-            expr = (self.variables['od_num_loads'][o,d,t] == 
-                   pulp.lpSum(self.parameters['period_weight'].get(int(t),1) * 
-                            self.variables['num_loads'][o,d,t,m] 
-                            for m in self.network_sets['MODES']))
-            model += (expr, f"od_num_loads_{o}_{d}_{t}")
+            self._eq(
+                model,
+                self.variables['od_num_loads'][o,d,t],
+                pulp.LpAffineExpression(od_terms.get((o, d, t), [])),
+                f"od_num_loads_{o}_{d}_{t}"
+            )
 
         # Mode number of loads constraints
         for m, t in product(self.network_sets['MODES'], self.network_sets['PERIODS']):
-            expr = (self.variables['mode_num_loads'][m,t] == 
-                   pulp.lpSum(self.parameters['period_weight'].get(int(t),1) * 
-                            self.variables['num_loads'][o,d,t,m] 
-                            for o, d in product(self.network_sets['DEPARTING_NODES'], 
-                                              self.network_sets['RECEIVING_NODES'])))
-            model += (expr, f"mode_num_loads_{m}_{t}")
+            self._eq(
+                model,
+                self.variables['mode_num_loads'][m,t],
+                pulp.LpAffineExpression(mode_terms[m, t]),
+                f"mode_num_loads_{m}_{t}"
+            )
 
         # Total OD number of loads
-        for o, d in product(self.network_sets['DEPARTING_NODES'], self.network_sets['RECEIVING_NODES']):
-            expr = (self.variables['total_od_num_loads'][o,d] == 
-                   pulp.lpSum(self.variables['od_num_loads'][o,d,t] 
-                            for t in self.network_sets['PERIODS']))
-            model += (expr, f"total_od_num_loads_{o}_{d}")
+        for o, d in lanes:
+            self._eq(
+                model,
+                self.variables['total_od_num_loads'][o,d],
+                pulp.LpAffineExpression(
+                    (self.variables['od_num_loads'][o,d,t], 1)
+                    for t in self.network_sets['PERIODS']
+                ),
+                f"total_od_num_loads_{o}_{d}"
+            )
 
         # Total mode number of loads
         for m in self.network_sets['MODES']:
-            expr = (self.variables['total_mode_num_loads'][m] == 
-                   pulp.lpSum(self.variables['mode_num_loads'][m,t] 
-                            for t in self.network_sets['PERIODS']))
-            model += (expr, f"total_mode_num_loads_{m}")
+            self._eq(
+                model,
+                self.variables['total_mode_num_loads'][m],
+                pulp.LpAffineExpression(
+                    (self.variables['mode_num_loads'][m,t], 1)
+                    for t in self.network_sets['PERIODS']
+                ),
+                f"total_mode_num_loads_{m}"
+            )
 
         # Total number of loads per period
         for t in self.network_sets['PERIODS']:
-            expr = (self.variables['total_num_loads'][t] == 
-                   pulp.lpSum(self.variables['mode_num_loads'][m,t] 
-                            for m in self.network_sets['MODES']))
-            model += (expr, f"total_num_loads_{t}")
+            self._eq(
+                model,
+                self.variables['total_num_loads'][t],
+                pulp.LpAffineExpression(
+                    (self.variables['mode_num_loads'][m,t], 1)
+                    for m in self.network_sets['MODES']
+                ),
+                f"total_num_loads_{t}"
+            )
 
     def _build_cost_calculation_constraints(self, model: pulp.LpProblem) -> None:
-        has_distance_cost = (self.parameters['distance'] and 
-                           self.parameters['transportation_cost_variable_distance'])
-        has_time_cost = (self.parameters['transportation_cost_variable_time'] and 
-                        self.parameters['transit_time'])
-        
-        if has_distance_cost or has_time_cost:
-            for o, d, t, m, u, g, g2 in product(
-                self.network_sets['DEPARTING_NODES'],
-                self.network_sets['RECEIVING_NODES'],
-                self.network_sets['PERIODS'],
-                self.network_sets['MODES'],
-                self.network_sets['MEASURES'],
-                self.network_sets['NODEGROUPS'],
-                self.network_sets['NODEGROUPS']
-            ):
-                if self.parameters['node_in_nodegroup'].get((o,g),0)==1 and self.parameters['node_in_nodegroup'].get((d,g2),0)==1:
-                    expr = (self.variables['variable_transportation_costs'][o,d,t,m,u] >= 
-                           pulp.lpSum(self.parameters['period_weight'].get(int(t),1) * 
-                                    self.variables['departed_measures'][o,d,p,t,m,u] * 
-                                    (self.parameters['transportation_cost_variable_distance'].get((o,d,m,'unit',u,t,g,g2),
-                                                                                               self.big_m) * 
-                                     self.parameters['distance'].get((o,d,m),self.big_m) + 
-                                     self.parameters['transportation_cost_variable_time'].get((o,d,m,'unit',u,t,g,g2),
-                                                                                           self.big_m) * 
-                                     self.parameters['transit_time'].get((o,d,m),self.big_m)) 
-                                    for p in self.network_sets['PRODUCTS']))
-                    model += (expr, f"variable_transportation_costs_{o}_{d}_{t}_{m}_{u}_{g}_{g2}")
-
-        if self.parameters['transportation_cost_fixed']:
-            for o, d, t, m, u, g, g2 in product(
+        distance = self.parameters['distance']
+        transit_time = self.parameters['transit_time']
+        cost_variable_distance = self.parameters['transportation_cost_variable_distance']
+        cost_variable_time = self.parameters['transportation_cost_variable_time']
+        cost_fixed = self.parameters['transportation_cost_fixed']
+        cost_minimum = self.parameters['transportation_cost_minimum']
+        period_weight = self.period_weight
+        departed_measures = self.variables['departed_measures']
+        variable_transportation_costs = self.variables['variable_transportation_costs']
+        fixed_transportation_costs = self.variables['fixed_transportation_costs']
+        transportation_costs = self.variables['transportation_costs']
+        num_loads_by_lane = self.variables['num_loads']
+        assignments = self.variables['binary_product_destination_assignment']
+        big_m = self.big_m
+        products = self.network_sets['PRODUCTS']
+        measures = self.network_sets['MEASURES']
+        has_distance_cost = distance and cost_variable_distance
+        has_time_cost = cost_variable_time and transit_time
+        # Distance and transit time of every lane, shared by the unit and per-load cost rows
+        lane_lengths = {
+            (o, d, m): (distance.get((o,d,m), big_m), transit_time.get((o,d,m), big_m))
+            for o, d, m in product(
                 self.network_sets['DEPARTING_NODES'],
                 self.network_sets['RECEIVING_NODES'],
-                self.network_sets['PERIODS'],
-                self.network_sets['MODES'],
-                self.network_sets['MEASURES'],
-                self.network_sets['NODEGROUPS'],
-                self.network_sets['NODEGROUPS']
-            ):
-                if self.parameters['node_in_nodegroup'].get((o,g),0)==1 and self.parameters['node_in_nodegroup'].get((d,g2),0)==1:
-                    expr = (self.variables['fixed_transportation_costs'][o,d,t,m,u] >= 
-                           pulp.lpSum(self.parameters['period_weight'].get(int(t),1) *
-                                    self.variables['departed_measures'][o,d,p,t,m,u] * 
-                                    self.parameters['transportation_cost_fixed'].get((o,d,m,'unit',u,t,g,g2),
-                                                                                  self.big_m) 
-                                    for p in self.network_sets['PRODUCTS']))
-                    model += (expr, f"fixed_transportation_costs_{o}_{d}_{t}_{m}_{u}_{g}_{g2}")
-
-        if has_distance_cost or has_time_cost or self.parameters['transportation_cost_fixed']:
-            for o, d, t, m, g, g2 in product(
+                self.network_sets['MODES']
+            )
+        }
+        group_pairs = self.lane_group_pairs
+        
+        if has_distance_cost or has_time_cost or cost_fixed:
+            for o, d, t, m in product(
                 self.network_sets['DEPARTING_NODES'],
                 self.network_sets['RECEIVING_NODES'],
                 self.network_sets['PERIODS'],
-                self.network_sets['MODES'],
-                self.network_sets['NODEGROUPS'],
-                self.network_sets['NODEGROUPS']
+                self.network_sets['MODES']
             ):
-                if self.parameters['node_in_nodegroup'].get((o,g),0)==1 and self.parameters['node_in_nodegroup'].get((d,g2),0)==1:
-                    expr = (self.variables['transportation_costs'][o,d,t,m] >= 
-                           (self.parameters['period_weight'].get(int(t),1) * 
-                            self.variables['num_loads'][o,d,t,m] * 
-                            (self.parameters['transportation_cost_variable_distance'].get((o,d,m,'load','count',t,g,g2),
-                                                                                       self.big_m) * 
-                             self.parameters['distance'].get((o,d,m),self.big_m) +
-                             self.parameters['transportation_cost_variable_time'].get((o,d,m,'load','count',t,g,g2),
-                                                                                   self.big_m) * 
-                             self.parameters['transit_time'].get((o,d,m),self.big_m) +
-                             self.parameters['transportation_cost_fixed'].get((o,d,m,'load','count',t,g,g2),
-                                                                           self.big_m))) +
-                           pulp.lpSum(self.variables['variable_transportation_costs'][o,d,t,m,u] + 
-                                    self.variables['fixed_transportation_costs'][o,d,t,m,u] 
-                                    for u in self.network_sets['MEASURES']))
-                    model += (expr, f"transportation_costs_{o}_{d}_{t}_{m}_{g}_{g2}")
-
-        if self.parameters['transportation_cost_minimum']:
-            for o, d, t, m, p, g, g2 in product(
+                # Lane lengths and period weight do not depend on the measure or node groups
+                lane_distance, lane_time = lane_lengths[o,d,m]
+                weight = period_weight[t]
+                lane_group_pairs = group_pairs[o, d]
+
+                for u in measures:
+                    if has_distance_cost or has_time_cost:
+                        # The per-unit cost does not depend on the product
+                        coef, g, g2 = self._get_largest_group_pair_cost(
+                            (
+                                (
+                                    cost_variable_distance.get((o,d,m,'unit',u,t,g,g2), big_m) * lane_distance + 
+                                    cost_variable_time.get((o,d,m,'unit',u,t,g,g2), big_m) * lane_time
+                                ) * weight,
+                                g,
+                                g2
+                            )
+                            for g, g2 in lane_group_pairs
+                        )
+                        # A zero cost leaves only the cost variable's zero lower bound
+                        if coef > 0:
+                            self._geq(
+                                model,
+                                variable_transportation_costs[o,d,t,m,u],
+                                pulp.LpAffineExpression(
+                                    (departed_measures[o,d,p,t,m,u], coef)
+                                    for p in products
+                                ),
+                                f"variable_transportation_costs_{o}_{d}_{t}_{m}_{u}_{g}_{g2}"
+                            )
+
+                    if cost_fixed:
+                        coef, g, g2 = self._get_largest_group_pair_cost(
+                            (cost_fixed.get((o,d,m,'unit',u,t,g,g2), big_m) * weight, g, g2)
+                            for g, g2 in lane_group_pairs
+                        )
+                        if coef > 0:
+                            self._geq(
+                                model,
+                                fixed_transportation_costs[o,d,t,m,u],
+                                pulp.LpAffineExpression(
+                                    (departed_measures[o,d,p,t,m,u], coef)
+                                    for p in products
+                                ),
+                                f"fixed_transportation_costs_{o}_{d}_{t}_{m}_{u}_{g}_{g2}"
+                            )
+
+                if not lane_group_pairs:
+                    continue
+                # The per-measure costs are the same for every node group pair
+                measure_costs = [
+                    term
+                    for u in measures
+                    for term in (
+                        (variable_transportation_costs[o,d,t,m,u], 1),
+                        (fixed_transportation_costs[o,d,t,m,u], 1)
+                    )
+                ]
+                load_cost, g, g2 = self._get_largest_group_pair_cost(
+                    (
+                        (
+                            cost_variable_distance.get((o,d,m,'load','count',t,g,g2), big_m) * lane_distance +
+                            cost_variable_time.get((o,d,m,'load','count',t,g,g2), big_m) * lane_time +
+                            cost_fixed.get((o,d,m,'load','count',t,g,g2), big_m)
+                        ) * weight,
+                        g,
+                        g2
+                    )
+                    for g, g2 in lane_group_pairs
+                )
+                expr = pulp.LpAffineExpression(measure_costs)
+                if load_cost != 0:
+                    expr.addterm(num_loads_by_lane[o,d,t,m], load_cost)
+                self._geq(
+                    model,
+                    transportation_costs[o,d,t,m],
+                    expr,
+                    f"transportation_costs_{o}_{d}_{t}_{m}_{g}_{g2}"
+                )
+
+        if cost_minimum:
+            # Lanes and node group pairs with at least one minimum given; a pair with none
+            # would only get the all-big_m default, which is not a real minimum
+            minimum_given = {(o, d, m, t, g, g2) for o, d, m, _, _, t, g, g2 in cost_minimum}
+            for o, d, t, m in product(
                 self.network_sets['DEPARTING_NODES'],
                 self.network_sets['RECEIVING_NODES'],
                 self.network_sets['PERIODS'],
-                self.network_sets['MODES'],
-                self.network_sets['PRODUCTS'],
-                self.network_sets['NODEGROUPS'],
-                self.network_sets['NODEGROUPS']
+                self.network_sets['MODES']
             ):
-                if self.parameters['node_in_nodegroup'].get((o,g),0)==1 and self.parameters['node_in_nodegroup'].get((d,g2),0)==1:
-                    expr = (self.variables['transportation_costs'][o,d,t,m] >= 
-                           pulp.lpSum(self.parameters['transportation_cost_minimum'].get((o,d,m,'unit',u,t,g,g2),
-                                                                                      self.big_m) 
-                                    for u in self.network_sets['MEASURES']) *
-                           self.variables['binary_product_destination_assignment'][o,t,p,d] + 
-                           self.parameters['transportation_cost_minimum'].get((o,d,m,'load','count',t,g,g2),
-                                                                           self.big_m) *
-                           self.variables['binary_product_destination_assignment'][o,t,p,d])
-                    model += (expr, f"transportation_costs_minimum_{o}_{d}_{t}_{m}_{p}_{g}_{g2}")
+                # Unit and per-load minimums both apply to the same assignment binary
+                coef, g, g2 = self._get_largest_group_pair_cost(
+                    (
+                        sum(
+                            cost_minimum.get((o,d,m,'unit',u,t,g,g2), big_m)
+                            for u in measures
+                        ) + cost_minimum.get((o,d,m,'load','count',t,g,g2), big_m),
+                        g,
+                        g2
+                    )
+                    for g, g2 in group_pairs[o, d]
+                    if (o, d, m, t, g, g2) in minimum_given
+                )
+                # The assignment is binary and costs are nonnegative, so a minimum of zero or less never binds
+                if coef <= 0:
+                    continue
+                for p in products:
+                    self._geq(
+                        model,
+                        transportation_costs[o,d,t,m],
+                        pulp.LpAffineExpression([(assignments[o,t,p,d], coef)]),
+                        f"transportation_costs_minimum_{o}_{d}_{t}_{m}_{p}_{g}_{g2}"
+                    )
 
     def _build_total_cost_constraints(self, model: pulp.LpProblem) -> None:
-        # OD transportation costs
-        for o, d, t in product(
-            self.network_sets['DEPARTING_NODES'],
-            self.network_sets['RECEIVING_NODES'],
-            self.network_sets['PERIODS']
+        departing_nodes = self.network_sets['DEPARTING_NODES']
+        receiving_nodes = self.network_sets['RECEIVING_NODES']
+        periods = self.network_sets['PERIODS']
+        modes = self.network_sets['MODES']
+        variable_transportation_costs = self.variables['variable_transportation_costs']
+        fixed_transportation_costs = self.variables['fixed_transportation_costs']
+        transportation_costs = self.variables['transportation_costs']
+
+        # Walk each cost variable once and add it to every total it rolls up into
+        od_terms = {key: [] for key in product(departing_nodes, receiving_nodes, periods)}
+        mode_terms = {key: [] for key in product(modes, periods)}
+        for o, d, t, m, u in product(
+            departing_nodes, receiving_nodes, periods, modes, self.network_sets['MEASURES']
         ):
-            expr = (self.variables['od_transportation_costs'][o,d,t] >= 
-                   pulp.lpSum(self.variables['variable_transportation_costs'][o,d,t,m,u] + 
-                            self.variables['fixed_transportation_costs'][o,d,t,m,u] 
-                            for m, u in product(self.network_sets['MODES'], 
-                                              self.network_sets['MEASURES'])))
-            model += (expr, f"od_transportation_costs_{o}_{d}_{t}")
+            terms = (
+                (variable_transportation_costs[o,d,t,m,u], 1),
+                (fixed_transportation_costs[o,d,t,m,u], 1)
+            )
+            od_terms[o,d,t].extend(terms)
+            mode_terms[m,t].extend(terms)
+
+        total_od_terms = {key: [] for key in product(departing_nodes, receiving_nodes)}
+        total_mode_terms = {m: [] for m in modes}
+        total_time_terms = {t: [] for t in periods}
+        for o, d, t, m in product(departing_nodes, receiving_nodes, periods, modes):
+            term = (transportation_costs[o,d,t,m], 1)
+            total_od_terms[o,d].append(term)
+            total_mode_terms[m].append(term)
+            total_time_terms[t].append(term)
+
+        # OD transportation costs
+        for (o, d, t), terms in od_terms.items():
+            self._geq(
+                model,
+                self.variables['od_transportation_costs'][o,d,t],
+                pulp.LpAffineExpression(terms),
+                f"od_transportation_costs_{o}_{d}_{t}"
+            )
         
         # Mode transportation costs
-        for m, t in product(self.network_sets['MODES'], self.network_sets['PERIODS']):
-            expr = (self.variables['mode_transportation_costs'][t,m] >= 
-                   pulp.lpSum(self.variables['variable_transportation_costs'][o,d,t,m,u] + 
-                            self.variables['fixed_transportation_costs'][o,d,t,m,u] 
-                            for o, d, u in product(self.network_sets['DEPARTING_NODES'],
-                                                 self.network_sets['RECEIVING_NODES'],
-                                                 self.network_sets['MEASURES'])))
-            model += (expr, f"mode_transportation_costs_{t}_{m}")
+        for (m, t), terms in mode_terms.items():
+            self._geq(
+                model,
+                self.variables['mode_transportation_costs'][t,m],
+                pulp.LpAffineExpression(terms),
+                f"mode_transportation_costs_{t}_{m}"
+            )
 
         # Total OD transportation costs
-        for o, d in product(self.network_sets['DEPARTING_NODES'], self.network_sets['RECEIVING_NODES']):
-            expr = (self.variables['total_od_transportation_costs'][o,d] >= 
-                   pulp.lpSum(self.variables['transportation_costs'][o,d,t,m] 
-                            for t, m in product(self.network_sets['PERIODS'],
-                                              self.network_sets['MODES'])))
-            model += (expr, f"total_od_transportation_costs_{o}_{d}")
+        for (o, d), terms in total_od_terms.items():
+            self._geq(
+                model,
+                self.variables['total_od_transportation_costs'][o,d],
+                pulp.LpAffineExpression(terms),
+                f"total_od_transportation_costs_{o}_{d}"
+            )
 
         # Total mode transportation costs
-        for m in self.network_sets['MODES']:
-            expr = (self.variables['total_mode_transportation_costs'][m] >= 
-                   pulp.lpSum(self.variables['transportation_costs'][o,d,t,m] 
-                            for o, d, t in product(self.network_sets['DEPARTING_NODES'],
-                                                 self.network_sets['RECEIVING_NODES'],
-                                                 self.network_sets['PERIODS'])))
-            model += (expr, f"total_mode_transportation_costs_{m}")
+        for m, terms in total_mode_terms.items():
+            self._geq(
+                model,
+                self.variables['total_mode_transportation_costs'][m],
+                pulp.LpAffineExpression(terms),
+                f"total_mode_transportation_costs_{m}"
+            )
 
         # Total time transportation costs
-        for t in self.network_sets['PERIODS']:
-            expr = (self.variables['total_time_transportation_costs'][t] >= 
-                   pulp.lpSum(self.variables['transportation_costs'][o,d,t,m] 
-                            for o, d, m in product(self.network_sets['DEPARTING_NODES'],
-                                                 self.network_sets['RECEIVING_NODES'],
-                                                 self.network_sets['MODES'])))
-            model += (expr, f"total_time_transportation_costs_{t}")
+        for t, terms in total_time_terms.items():
+            self._geq(
+                model,
+                self.variables['total_time_transportation_costs'][t],
+                pulp.LpAffineExpression(terms),
+                f"total_time_transportation_costs_{t}"
+            )
 
         # Grand total transportation costs
-        expr = (self.variables['grand_total_transportation_costs'] >= 
-               pulp.lpSum(self.variables['total_time_transportation_costs'][t] 
-                        for t in self.network_sets['PERIODS']))
-        model += (expr, "grand_total_transportation_costs")
+        self._geq(
+            model,
+            self.variables['grand_total_transportation_costs'],
+            pulp.LpAffineExpression(
+                (self.variables['total_time_transportation_costs'][t], 1)
+                for t in periods
+            ),
+            "grand_total_transportation_costs"
+        )
     
     def _build_shipping_assembly_constraints(self, model: pulp.LpProblem) -> None:
         """Build constraints for assembly requirements in shipping"""
-        for t, p1, p2, n_d, n_r, g_d, g_r, m in product(
-            self.network_sets['PERIODS'],
-            self.network_sets['PRODUCTS'],
-            self.network_sets['PRODUCTS'],
-            self.network_sets['DEPARTING_NODES'],
-            self.network_sets['RECEIVING_NODES'],
-            self.network_sets['NODEGROUPS'],
-            self.network_sets['NODEGROUPS'],
-            self.network_sets['MODES']
-        ):
-            if (self.parameters['node_in_nodegroup'].get((n_d,g_d),0)==1 and 
-                self.parameters['node_in_nodegroup'].get((n_r,g_r),0)==1):
-                if (self.parameters['shipping_assembly_p1_required'].get((n_d,n_r,g_d,g_r,p1,p2)) is not None and 
-                    self.parameters['shipping_assembly_p2_required'].get((n_d,n_r,g_d,g_r,p1,p2)) is not None):
-                    expr = (
-                        self.variables['departed_product_by_mode'][n_d,n_r,p1,t,m] * 
-                        self.parameters['shipping_assembly_p1_required'][n_d,n_r,g_d,g_r,p1,p2] == 
-                        self.variables['departed_product_by_mode'][n_d,n_r,p2,t,m] * 
-                        self.parameters['shipping_assembly_p2_required'][n_d,n_r,g_d,g_r,p1,p2]
-                    )
-                    model += (expr, f"shipping_volume_assembly_constraints_{n_d}_{n_r}_{t}_{p1}_{p2}_{g_d}_{g_r}_{m}")
+        departing_nodes = set(self.network_sets['DEPARTING_NODES'])
+        receiving_nodes = set(self.network_sets['RECEIVING_NODES'])
+        products = set(self.network_sets['PRODUCTS'])
+        p2_required = self.parameters['shipping_assembly_p2_required']
+        departed_product_by_mode = self.variables['departed_product_by_mode']
+        # Only periods, lanes, groups and product pairs with both requirements set get a row
+        for key, p1_req in self.parameters['shipping_assembly_p1_required'].items():
+            t, n_d, n_r, g_d, g_r, p1, p2 = key
+            p2_req = p2_required.get(key)
+            if p1_req is None or p2_req is None:
+                continue
+            if not (t in self.period_index and
+                    n_d in departing_nodes and n_r in receiving_nodes and
+                    p1 in products and p2 in products and
+                    (n_d, g_d) in self.node_group_pairs and
+                    (n_r, g_r) in self.node_group_pairs):
+                continue
+            for m in self.network_sets['MODES']:
+                self._eq(
+                    model,
+                    departed_product_by_mode[n_d,n_r,p1,t,m] * p1_req,
+                    departed_product_by_mode[n_d,n_r,p2,t,m] * p2_req,
+                    f"shipping_volume_assembly_constraints_{n_d}_{n_r}_{t}_{p1}_{p2}_{g_d}_{g_r}_{m}"
+                )
 
     def _build_departed_measures_constraints(self, model: pulp.LpProblem) -> None:
         """Build constraints for departed measures calculations"""
+        products_measures = self.parameters['products_measures']
+        departed_measures = self.variables['departed_measures']
+        departed_product_by_mode = self.variables['departed_product_by_mode']
         for o, d, p, t, m, u in product(
             self.network_sets['DEPARTING_NODES'],
             self.network_sets['RECEIVING_NODES'],
@@ -286,18 +476,41 @@ class TransportationConstraints(BaseConstraint):
             self.network_sets['MODES'],
             self.network_sets['MEASURES']
         ):
-            expr = (
-                self.variables['departed_measures'][o, d, p, t, m, u] == 
-                pulp.lpSum(
-                    self.variables['departed_product_by_mode'][o,d,p,t,m] * 
-                    self.parameters['products_measures'].get((p,u),0) 
-                    for p in self.network_sets['PRODUCTS']
-                )
+            # Each product's measure comes from its own departed volume only
+            measure = products_measures.get((p,u),0)
+            self._eq(
+                model,
+                departed_measures[o, d, p, t, m, u],
+                pulp.LpAffineExpression(
+                    [(departed_product_by_mode[o,d,p,t,m], measure)]
+                    if measure != 0 else []
+                ),
+                f"DepartedMeasures_{o}_{d}_{p}_{t}_{m}_{u}"
             )
-            model += (expr, f"DepartedMeasures_{o}_{d}_{p}_{t}_{m}_{u}")
 
     def _build_transportation_capacity_option_constraints(self, model: pulp.LpProblem) -> None:
         """Build constraints for transportation capacity options"""
+        # Index combinations summed over by the aggregate rows, materialized once
+        lanes = self.lanes
+        period_expansions = tuple(product(self.network_sets['PERIODS'], self.network_sets['T_CAPACITY_EXPANSIONS']))
+        lane_expansions = tuple((o, d, e_t) for (o, d), e_t in product(lanes, self.network_sets['T_CAPACITY_EXPANSIONS']))
+        lane_periods = tuple((o, d, t) for (o, d), t in product(lanes, self.network_sets['PERIODS']))
+        use_option = self.variables['use_transportation_capacity_option']
+        expansion_cost = self.parameters['transportation_expansion_cost']
+        min_count = self.parameters['transportation_expansion_min_count']
+        max_count = self.parameters['transportation_expansion_max_count']
+        persisting_costs = self.parameters['transportation_expansion_persisting_cost']
+        t_capacity_option_cost = self.variables['t_capacity_option_cost']
+
+        # Period-weighted expansion cost term of every option use, shared by all cost rows below
+        expansions = set(self.network_sets['T_CAPACITY_EXPANSIONS'])
+        option_terms = {}
+        for (t, o, d, e_t), cost in expansion_cost.items():
+            if (o, d) in self.lane_group_pairs and t in self.period_weight and e_t in expansions:
+                coef = self.period_weight[t] * cost
+                if coef != 0:
+                    option_terms[o,d,e_t,t] = (use_option[o,d,e_t,t], coef)
+
         # Minimum count constraints
         for t, o, d, e_t in product(
             self.network_sets['PERIODS'],
@@ -305,33 +518,44 @@ class TransportationConstraints(BaseConstraint):
             self.network_sets['RECEIVING_NODES'],
             self.network_sets['T_CAPACITY_EXPANSIONS']
         ):
-            expr = (
-                self.variables['use_transportation_capacity_option'][o,d,e_t,t] >= 
-                self.parameters['transportation_expansion_min_count'].get((t,o,d,e_t),0)
+            self._geq(
+                model,
+                use_option[o,d,e_t,t],
+                min_count.get((t,o,d,e_t),0),
+                f"TransportationCapacityOptionMinCount_{t}_{o}_{d}_{e_t}"
             )
-            model += (expr, f"TransportationCapacityOptionMinCount_{t}_{o}_{d}_{e_t}")
 
             # Maximum count constraints
-            expr = (
-                self.variables['use_transportation_capacity_option'][o,d,e_t,t] >= 
-                self.parameters['transportation_expansion_max_count'].get((t,o,d,e_t),0)
+            self._geq(
+                model,
+                use_option[o,d,e_t,t],
+                max_count.get((t,o,d,e_t),0),
+                f"TransportationCapacityOptionMaxCount_{t}_{o}_{d}_{e_t}"
             )
-            model += (expr, f"TransportationCapacityOptionMaxCount_{t}_{o}_{d}_{e_t}")
 
             # Cost calculation
-            expr = (
-                self.variables['t_capacity_option_cost'][t,o,d,e_t] ==
-                self.parameters['period_weight'].get(int(t),1) * 
-                self.variables['use_transportation_capacity_option'][o,d,e_t,t] * 
-                self.parameters['transportation_expansion_cost'].get((t,o,d,e_t),0) +
-                self.variables['use_transportation_capacity_option'][o,d,e_t,t] * 
-                pulp.lpSum(
-                    self.parameters['transportation_expansion_persisting_cost'].get((t2,o,d,e_t),0) 
-                    for t2 in self.network_sets['PERIODS'] 
-                    if int(t2) >= int(t)
-                )
+            persisting_cost = sum(
+                persisting_costs.get((t2,o,d,e_t),0) 
+                for t2 in self.network_sets['PERIODS'] 
+                if self.period_index[t2] >= self.period_index[t]
+            )
+            coef = (
+                option_terms[o,d,e_t,t][1] if (o,d,e_t,t) in option_terms else 0
+            ) + persisting_cost
+            self._eq(
+                model,
+                t_capacity_option_cost[t,o,d,e_t],
+                pulp.LpAffineExpression(
+                    [(use_option[o,d,e_t,t], coef)]
+                    if coef != 0 else []
+                ),
+                f"TransportationCapacityOptionCost_{t}_{o}_{d}_{e_t}"
+            )
+
+        def option_cost_terms(keys):
+            return pulp.LpAffineExpression(
+                [option_terms[key] for key in keys if key in option_terms]
             )
-            model += (expr, f"TransportationCapacityOptionCost_{t}_{o}_{d}_{e_t}")
 
         # Cost by location type
         for o, d, e_t in product(
@@ -339,145 +563,114 @@ class TransportationConstraints(BaseConstraint):
             self.network_sets['RECEIVING_NODES'],
             self.network_sets['T_CAPACITY_EXPANSIONS']
         ):
-            expr = (
-                self.variables['t_capacity_option_cost_by_location_type'][o,d,e_t] ==
-                pulp.lpSum(
-                    self.parameters['period_weight'].get(int(t),1) * 
-                    self.variables['use_transportation_capacity_option'][o,d,e_t,t] * 
-                    self.parameters['transportation_expansion_cost'].get((t,o,d,e_t),0) 
-                    for t in self.network_sets['PERIODS']
-                )
+            self._eq(
+                model,
+                self.variables['t_capacity_option_cost_by_location_type'][o,d,e_t],
+                option_cost_terms((o, d, e_t, t) for t in self.network_sets['PERIODS']),
+                f"TransportationCapacityOptionCostByLocationType_{o}_{d}_{e_t}"
             )
-            model += (expr, f"TransportationCapacityOptionCostByLocationType_{o}_{d}_{e_t}")
 
         # Cost by period type
         for e_t, t in product(
             self.network_sets['T_CAPACITY_EXPANSIONS'],
             self.network_sets['PERIODS']
         ):
-            expr = (
-                self.variables['t_capacity_option_cost_by_period_type'][e_t,t] ==
-                self.parameters['period_weight'].get(int(t),1) * 
-                pulp.lpSum(
-                    self.variables['use_transportation_capacity_option'][o,d,e_t,t] * 
-                    self.parameters['transportation_expansion_cost'].get((t,o,d,e_t),0) 
-                    for o, d in product(
-                        self.network_sets['DEPARTING_NODES'],
-                        self.network_sets['RECEIVING_NODES']
-                    )
-                )
+            self._eq(
+                model,
+                self.variables['t_capacity_option_cost_by_period_type'][e_t,t],
+                option_cost_terms((o, d, e_t, t) for o, d in lanes),
+                f"TransportationCapacityOptionCostByPeriodType_{e_t}_{t}"
             )
-            model += (expr, f"TransportationCapacityOptionCostByPeriodType_{e_t}_{t}")
 
         # Cost by location
-        for o, d in product(
-            self.network_sets['DEPARTING_NODES'],
-            self.network_sets['RECEIVING_NODES']
-        ):
-            expr = (
-                self.variables['t_capacity_option_cost_by_location'][o,d] ==
-                pulp.lpSum(
-                    self.parameters['period_weight'].get(int(t),1) * 
-                    self.variables['use_transportation_capacity_option'][o,d,e_t,t] * 
-                    self.parameters['transportation_expansion_cost'].get((t,o,d,e_t),0) 
-                    for t, e_t in product(
-                        self.network_sets['PERIODS'],
-                        self.network_sets['T_CAPACITY_EXPANSIONS']
-                    )
-                )
+        for o, d in lanes:
+            self._eq(
+                model,
+                self.variables['t_capacity_option_cost_by_location'][o,d],
+                option_cost_terms((o, d, e_t, t) for t, e_t in period_expansions),
+                f"TransportationCapacityOptionCostByLocation_{o}_{d}"
             )
-            model += (expr, f"TransportationCapacityOptionCostByLocation_{o}_{d}")
 
         # Cost by period
         for t in self.network_sets['PERIODS']:
-            expr = (
-                self.variables['t_capacity_option_cost_by_period'][t] ==
-                self.parameters['period_weight'].get(int(t),1) * 
-                pulp.lpSum(
-                    self.variables['use_transportation_capacity_option'][o,d,e_t,t] * 
-                    self.parameters['transportation_expansion_cost'].get((t,o,d,e_t),0) 
-                    for o, d, e_t in product(
-                        self.network_sets['DEPARTING_NODES'],
-                        self.network_sets['RECEIVING_NODES'],
-                        self.network_sets['T_CAPACITY_EXPANSIONS']
-                    )
-                )
+            self._eq(
+                model,
+                self.variables['t_capacity_option_cost_by_period'][t],
+                option_cost_terms((o, d, e_t, t) for o, d, e_t in lane_expansions),
+                f"TransportationCapacityOptionCostByPeriod_{t}"
             )
-            model += (expr, f"TransportationCapacityOptionCostByPeriod_{t}")
 
         # Cost by type
         for e_t in self.network_sets['T_CAPACITY_EXPANSIONS']:
-            expr = (
-                self.variables['t_capacity_option_cost_by_type'][e_t] ==
-                pulp.lpSum(
-                    self.parameters['period_weight'].get(int(t),1) * 
-                    self.variables['use_transportation_capacity_option'][o,d,e_t,t] * 
-                    self.parameters['transportation_expansion_cost'].get((t,o,d,e_t),0) 
-                    for o, d, t in product(
-                        self.network_sets['DEPARTING_NODES'],
-                        self.network_sets['RECEIVING_NODES'],
-                        self.network_sets['PERIODS']
-                    )
-                )
+            self._eq(
+                model,
+                self.variables['t_capacity_option_cost_by_type'][e_t],
+                option_cost_terms((o, d, e_t, t) for o, d, t in lane_periods),
+                f"TransportationCapacityOptionCostByType_{e_t}"
             )
-            model += (expr, f"TransportationCapacityOptionCostByType_{e_t}")
 
         # Grand total capacity option cost
-        expr = (
-            self.variables['grand_total_t_capacity_option'] ==
-            pulp.lpSum(
-                self.parameters['period_weight'].get(int(t),1) * 
-                self.variables['use_transportation_capacity_option'][o,d,e_t,t] * 
-                self.parameters['transportation_expansion_cost'].get((t,o,d,e_t),0) 
-                for o, d, t, e_t in product(
+        self._eq(
+            model,
+            self.variables['grand_total_t_capacity_option'],
+            option_cost_terms(
+                (o, d, e_t, t) for o, d, t, e_t in product(
                     self.network_sets['DEPARTING_NODES'],
                     self.network_sets['RECEIVING_NODES'],
                     self.network_sets['PERIODS'],
                     self.network_sets['T_CAPACITY_EXPANSIONS']
                 )
-            )
+            ),
+            "GrandTotalTransportationCapacityOption"
         )
-        model += (expr, "GrandTotalTransportationCapacityOption")
 
     def _build_distance_time_constraints(self, model: pulp.LpProblem) -> None:
         """Build constraints for distance and transit time limits"""
+        departing_nodes = set(self.network_sets['DEPARTING_NODES'])
+        receiving_nodes = set(self.network_sets['RECEIVING_NODES'])
+        periods = set(self.network_sets['PERIODS'])
+        modes = set(self.network_sets['MODES'])
+        big_m = self.big_m
+        products = tuple(self.network_sets['PRODUCTS'])
+        distance = self.parameters.get('distance')
+        max_distance_limits = self.parameters.get('max_distance')
+        transit_time = self.parameters.get('transit_time')
+        max_transit_time = self.parameters.get('max_transit_time')
+        assigned = self.variables['is_destination_assigned_to_origin']
+        departed_product_by_mode = self.variables['departed_product_by_mode']
+
+        def is_limited_lane(o, t, m, g, d, g2):
+            return (o in departing_nodes and d in receiving_nodes and
+                    t in periods and m in modes and
+                    (o, g) in self.node_group_pairs and
+                    (d, g2) in self.node_group_pairs)
+
+        # A missing limit defaults to big_m, which no lane exceeds, so only the
+        # limits given in the inputs can produce rows
+
         # Distance constraints
-        if self.parameters.get('distance') and self.parameters.get('max_distance'):
-            for o, d, t, m, g, g2 in product(
-                self.network_sets['DEPARTING_NODES'],
-                self.network_sets['RECEIVING_NODES'],
-                self.network_sets['PERIODS'],
-                self.network_sets['MODES'],
-                self.network_sets['NODEGROUPS'],
-                self.network_sets['NODEGROUPS']
-            ):
-                if (self.parameters['node_in_nodegroup'].get((o,g),0)==1 and 
-                    self.parameters['node_in_nodegroup'].get((d,g2),0)==1):
-                    expr = (
-                        self.variables['is_destination_assigned_to_origin'][o,d,t] * 
-                        self.parameters['distance'].get((o,d,m), self.big_m) <= 
-                        self.parameters['max_distance'].get((o,t,m,g,d,g2), self.big_m)
-                    )
-                    model += (expr, f"distance_{o}_{d}_{t}_{m}_{g}_{d}_{g2}")
+        if distance and max_distance_limits:
+            for (o, t, m, g, d, g2), max_distance in max_distance_limits.items():
+                if not is_limited_lane(o, t, m, g, d, g2):
+                    continue
+                lane_distance = distance.get((o,d,m), big_m)
+                # The assignment is binary, so the limit only binds on lanes longer than it
+                if max(lane_distance, 0) <= max_distance:
+                    continue
+                self._leq(
+                    model,
+                    assigned[o,d,t] * lane_distance,
+                    max_distance,
+                    f"distance_{o}_{d}_{t}_{m}_{g}_{d}_{g2}"
+                )
 
         # Transit time constraints
-        if self.parameters.get('transit_time') and self.parameters.get('max_transit_time'):
-            for n_d, n_r, t, m, g, g2 in product(
-                self.network_sets['DEPARTING_NODES'],
-                self.network_sets['RECEIVING_NODES'],
-                self.network_sets['PERIODS'],
-                self.network_sets['MODES'],
-                self.network_sets['NODEGROUPS'],
-                self.network_sets['NODEGROUPS']
-            ):
-                if (self.parameters['node_in_nodegroup'].get((n_d,g),0)==1 and 
-                    self.parameters['node_in_nodegroup'].get((n_r,g2),0)==1):
-                    if (self.parameters['transit_time'].get((n_d,n_r,m),0) > 
-                        self.parameters['max_transit_time'].get((n_d,t,m,g,n_r,g2), self.big_m)):
-                        expr = (
-                            pulp.lpSum(
-                                self.variables['departed_product_by_mode'][n_d,n_r,p,t,m] 
-                                for p in self.network_sets['PRODUCTS']
-                            ) == 0
-                        )
-                        model += (expr, f"transit_time_{n_d}_{n_r}_{t}_{m}_{g}_{n_r}_{g2}")
\ No newline at end of file
+        if transit_time and max_transit_time:
+            for (n_d, t, m, g, n_r, g2), max_time in max_transit_time.items():
+                if not is_limited_lane(n_d, t, m, g, n_r, g2):
+                    continue
+                # Departed volumes are nonnegative, so a lane that is too slow has all of them
+                # fixed at zero instead of a row forcing their sum to zero
+                if transit_time.get((n_d,n_r,m),0) > max_time:
+                    for p in products:
+                        departed_product_by_mode[n_d,n_r,p,t,m].upBound = 0
@@ -8,6 +8,34 @@ class ObjectiveFunctions:
     def __init__(self, variables: Dict[str, Any], network_sets: Dict[str, Any]):
         self.variables = variables
         self.network_sets = network_sets
+
+        # Volume variables summed by the objectives and their hierarchical bounds
+        self.dropped_demand_vars = [
+            variables['dropped_demand'][n, p, t]
+            for n, p, t in product(network_sets['NODES'], network_sets['PRODUCTS'], network_sets['PERIODS'])
+        ]
+        self.ib_carried_over_demand_vars = [
+            variables['ib_carried_over_demand'][n_r, p, t]
+            for n_r, p, t in product(network_sets['RECEIVING_NODES'], network_sets['PRODUCTS'], network_sets['PERIODS'])
+        ]
+        self.ob_carried_over_demand_vars = [
+            variables['ob_carried_over_demand'][n_d, p, t]
+            for n_d, p, t in product(network_sets['DEPARTING_NODES'], network_sets['PRODUCTS'], network_sets['PERIODS'])
+        ]
+
+        # Cost totals summed by the cost objective
+        self.cost_vars = [
+            variables['grand_total_transportation_costs'],
+            variables['grand_total_operating_costs'],
+            variables['grand_total_t_capacity_option'],
+            variables['grand_total_c_capacity_option'],
+            variables['grand_total_carried_and_dropped_volume_cost'],
+            variables['grand_total_launch_cost'],
+            variables['grand_total_shut_down_cost'],
+            variables['grand_total_pop_cost'],
+            variables['grand_total_age_violation_cost'],
+            variables['resource_grand_total_cost']
+        ]
     
     def minimize_maximum_transit_distance(self) -> pulp.LpVariable:
         """Objective: Minimize the maximum transit distance"""
@@ -31,41 +59,15 @@ class ObjectiveFunctions:
     
     def minimize_dropped_volume(self) -> pulp.LpAffineExpression:
         """Objective: Minimize total dropped volume"""
-        return pulp.lpSum(
-            self.variables['dropped_demand'][(n, p, t)] 
-            for n in self.network_sets['NODES'] 
-            for p in self.network_sets['PRODUCTS'] 
-            for t in self.network_sets['PERIODS']
-        )
+        return pulp.LpAffineExpression((var, 1) for var in self.dropped_demand_vars)
     
     def minimize_carried_over_volume(self) -> pulp.LpAffineExpression:
         """Objective: Minimize total carried over volume"""
-        return (
-            pulp.lpSum(
-                self.variables['ib_carried_over_demand'][(n_r, p, t)] 
-                for n_r in self.network_sets['RECEIVING_NODES']
-                for p in self.network_sets['PRODUCTS'] 
-                for t in self.network_sets['PERIODS']
-            ) +
-            pulp.lpSum(
-                self.variables['ob_carried_over_demand'][(n_d, p, t)] 
-                for n_d in self.network_sets['DEPARTING_NODES']
-                for p in self.network_sets['PRODUCTS'] 
-                for t in self.network_sets['PERIODS']
-            )
+        return pulp.LpAffineExpression(
+            [(var, 1) for var in self.ib_carried_over_demand_vars] +
+            [(var, 1) for var in self.ob_carried_over_demand_vars]
         )
     
     def minimize_cost(self) -> pulp.LpAffineExpression:
         """Objective: Minimize total cost"""
-        return (
-            self.variables['grand_total_transportation_costs'] +
-            self.variables['grand_total_operating_costs'] +
-            self.variables['grand_total_t_capacity_option'] +
-            self.variables['grand_total_c_capacity_option'] +
-            self.variables['grand_total_carried_and_dropped_volume_cost'] +
-            self.variables['grand_total_launch_cost'] +
-            self.variables['grand_total_shut_down_cost'] +
-            self.variables['grand_total_pop_cost'] +
-            self.variables['grand_total_age_violation_cost'] +
-            self.variables['resource_grand_total_cost']
-        )
\ No newline at end of file
+        return pulp.LpAffineExpression((var, 1) for var in self.cost_vars)
\ No newline at end of file
@@ -12,6 +12,43 @@ class ObjectiveHandler:
         self.parameters = parameters
         self.big_m = 999999999
         self.objective_functions = ObjectiveFunctions(variables, network_sets)
+        # Objective expressions by name, reused to bound each solved priority level
+        self._exprs = {}
+
+        self._builders = {
+            "Minimize Maximum Transit Distance": self.objective_functions.minimize_maximum_transit_distance,
+            "Minimize Maximum Age": self.objective_functions.minimize_maximum_age,
+            "Maximize Capacity": self.objective_functions.maximize_capacity,
+            "Minimize Maximum Utilization": self.objective_functions.minimize_maximum_utilization,
+            "Minimize Plan-Over-Plan Change": self.objective_functions.minimize_plan_over_plan_change,
+            "Minimize Dropped Volume": self.objective_functions.minimize_dropped_volume,
+            "Minimize Carried Over Volume": self.objective_functions.minimize_carried_over_volume,
+            "Minimize Cost": self.objective_functions.minimize_cost,
+        }
+        self._constrainers = {
+            "Minimize Maximum Transit Distance": self._constrain_max_transit_distance,
+            "Minimize Maximum Age": self._constrain_max_age,
+            "Maximize Capacity": self._constrain_capacity,
+            "Minimize Maximum Utilization": self._constrain_max_utilization,
+            "Minimize Plan-Over-Plan Change": self._constrain_plan_over_plan_change,
+            "Minimize Dropped Volume": self._constrain_objective_expression,
+            "Minimize Carried Over Volume": self._constrain_objective_expression,
+            "Minimize Cost": self._constrain_objective_expression,
+        }
+        # Single variable bounds are installed once per model and then moved with changeRHS
+        self._epi_names = {
+            "Minimize Maximum Transit Distance": "epi_max_transit_distance",
+            "Minimize Maximum Age": "epi_max_age",
+            "Maximize Capacity": "epi_total_capacity",
+            "Minimize Maximum Utilization": "epi_max_capacity_utilization",
+            "Minimize Plan-Over-Plan Change": "epi_total_volume_moved",
+        }
+
+        # Names of the end volume equals demand rows, dropped when maximizing capacity
+        self.demand_constraint_names = [
+            f"arrived_and_completed_product_equals_demand_{n_r}_{t}_{p}".replace(" ", "_").replace("-", "_")
+            for n_r, t, p in product(network_sets['RECEIVING_NODES'], network_sets['PERIODS'], network_sets['PRODUCTS'])
+        ]
 
     def set_single_objective(self, model: pulp.LpProblem, objective: str) -> None:
         """Set a single objective function
@@ -20,39 +57,16 @@ class ObjectiveHandler:
             model: PuLP model to set objective for
             objective: Name of the objective to set
         """
-        if objective == "Minimize Maximum Transit Distance":
-            objective_function = self.objective_functions.minimize_maximum_transit_distance()
-            
-        elif objective == "Minimize Maximum Age":
-            objective_function = self.objective_functions.minimize_maximum_age()
-            
-        elif objective == "Maximize Capacity":
-            # Drop constraint that end volume must equal demand
-            for n_r, t, p in product(self.network_sets['RECEIVING_NODES'], 
-                                   self.network_sets['PERIODS'], 
-                                   self.network_sets['PRODUCTS']):
-                try:
-                    del model.constraints[f"arrived_and_completed_product_equals_demand_{n_r}_{t}_{p}".replace(" ", "_").replace("-", "_")]
-                except:
-                    continue
-            objective_function = self.objective_functions.maximize_capacity()
-            
-        elif objective == "Minimize Maximum Utilization":
-            objective_function = self.objective_functions.minimize_maximum_utilization()
-            
-        elif objective == "Minimize Plan-Over-Plan Change":
-            objective_function = self.objective_functions.minimize_plan_over_plan_change()
-            
-        elif objective == "Minimize Dropped Volume":
-            objective_function = self.objective_functions.minimize_dropped_volume()
-            
-        elif objective == "Minimize Carried Over Volume":
-            objective_function = self.objective_functions.minimize_carried_over_volume()
-            
-        elif objective == "Minimize Cost":
-            objective_function = self.objective_functions.minimize_cost()
+        if objective == "Maximize Capacity":
+            self._drop_demand_constraints(model)
+        objective_function = self._builders[objective]()
+        self._exprs[objective] = objective_function
 
-        model += objective_function, "Objective"
+        # The same model is reused across priority levels, so replace rather than add.
+        # The model gets its own copy, which it renames, so the stored expression
+        # still bounds this level once it is solved.
+        model.setObjective(pulp.LpAffineExpression(objective_function))
+        model.objective.name = "Objective"
 
     def solve_and_set_constraint(self, model: pulp.LpProblem, objectives: List[str], 
                                relaxations: List[float], solver: pulp.LpSolver) -> pulp.LpProblem:
@@ -70,101 +84,69 @@ class ObjectiveHandler:
         result = model.solve(solver)
         
         for t in range(len(objectives)):
-            if objectives[t] == "Minimize Maximum Transit Distance":
-                max_distance_solution = self.variables['max_transit_distance'].varValue
-                model += (self.variables['max_transit_distance'] <= max_distance_solution * (1 + relaxations[t]))
-                
-            elif objectives[t] == "Minimize Maximum Age":
-                max_age_solution = self.variables['max_age'].varValue
-                model += (self.variables['max_age'] <= max_age_solution * (1 + relaxations[t]))
-                
-            elif objectives[t] == "Maximize Capacity":
-                # Drop constraint that end volume must equal demand
-                for n_r, t2, p in product(self.network_sets['RECEIVING_NODES'], 
-                                        self.network_sets['PERIODS'], 
-                                        self.network_sets['PRODUCTS']):
-                    try:
-                        del model.constraints[f"arrived_and_completed_product_equals_demand_{n_r}_{t2}_{p}".replace(" ", "_").replace("-", "_")]
-                    except:
-                        continue
-                total_capacity = self.variables['total_arrived_and_completed_product'].varValue
-                model += (self.variables['total_arrived_and_completed_product'] >= total_capacity * (1 - relaxations[t]))
-                
-            elif objectives[t] == "Minimize Maximum Utilization":
-                max_utilization_solution = self.variables['max_capacity_utilization'].varValue
-                model += (self.variables['max_capacity_utilization'] <= max_utilization_solution * (1 + relaxations[t]))
-                
-            elif objectives[t] == "Minimize Plan-Over-Plan Change":
-                vol_moved_solution = self.variables['total_volume_moved'].varValue
-                model += (self.variables['total_volume_moved'] <= vol_moved_solution * (1 + relaxations[t]))
-                
-            elif objectives[t] == "Minimize Dropped Volume":
-                dropped_volume = sum(
-                    self.variables['dropped_demand'][n,p,t].varValue
-                    for n in self.network_sets['NODES']
-                    for p in self.network_sets['PRODUCTS']
-                    for t in self.network_sets['PERIODS']
-                )
-                model += (
-                    pulp.lpSum(
-                        self.variables['dropped_demand'][(n, p, t)] 
-                        for n in self.network_sets['NODES']
-                        for p in self.network_sets['PRODUCTS']
-                        for t in self.network_sets['PERIODS']
-                    ) <= dropped_volume * (1 + relaxations[t])
-                )
-                
-            elif objectives[t] == "Minimize Carried Over Volume":
-                carried_over_volume = (
-                    sum(self.variables['ib_carried_over_demand'][n_r,p,t].varValue
-                        for n_r in self.network_sets['RECEIVING_NODES']
-                        for p in self.network_sets['PRODUCTS']
-                        for t in self.network_sets['PERIODS']) +
-                    sum(self.variables['ob_carried_over_demand'][n_d,p,t].varValue
-                        for n_d in self.network_sets['DEPARTING_NODES']
-                        for p in self.network_sets['PRODUCTS']
-                        for t in self.network_sets['PERIODS'])
-                )
-                model += (
-                    pulp.lpSum(
-                        self.variables['ib_carried_over_demand'][(n_r, p, t)] 
-                        for n_r in self.network_sets['RECEIVING_NODES']
-                        for p in self.network_sets['PRODUCTS']
-                        for t in self.network_sets['PERIODS']
-                    ) + 
-                    pulp.lpSum(
-                        self.variables['ob_carried_over_demand'][(n_d, p, t)] 
-                        for n_d in self.network_sets['DEPARTING_NODES']
-                        for p in self.network_sets['PRODUCTS']
-                        for t in self.network_sets['PERIODS']
-                    ) <= carried_over_volume * (1 + relaxations[t])
-                )
-                
-            elif objectives[t] == "Minimize Cost":
-                total_cost = (
-                    self.variables['grand_total_transportation_costs'].varValue +
-                    self.variables['grand_total_operating_costs'].varValue +
-                    self.variables['grand_total_c_capacity_option'].varValue +
-                    self.variables['grand_total_t_capacity_option'].varValue +
-                    self.variables['grand_total_carried_and_dropped_volume_cost'].varValue +
-                    self.variables['grand_total_launch_cost'].varValue +
-                    self.variables['grand_total_shut_down_cost'].varValue +
-                    self.variables['grand_total_pop_cost'].varValue +
-                    self.variables['grand_total_age_violation_cost'].varValue +
-                    self.variables['resource_grand_total_cost'].varValue
-                )
-                model += (
-                    (self.variables['grand_total_transportation_costs'] +
-                     self.variables['grand_total_operating_costs'] +
-                     self.variables['grand_total_t_capacity_option'] +
-                     self.variables['grand_total_c_capacity_option'] +
-                     self.variables['grand_total_carried_and_dropped_volume_cost'] +
-                     self.variables['grand_total_launch_cost'] +
-                     self.variables['grand_total_shut_down_cost'] +
-                     self.variables['grand_total_pop_cost'] +
-                     self.variables['grand_total_age_violation_cost'] +
-                     self.variables['resource_grand_total_cost']
-                    ) <= total_cost * (1 + relaxations[t])
-                )
+            self._constrainers[objectives[t]](model, objectives[t], relaxations[t])
         
-        return model
\ No newline at end of file
+        return model
+
+    def _drop_demand_constraints(self, model: pulp.LpProblem) -> None:
+        """Drop constraint that end volume must equal demand"""
+        for name in self.demand_constraint_names:
+            model.constraints.pop(name, None)
+
+    def _constrain_max_transit_distance(self, model: pulp.LpProblem, objective: str, relaxation: float) -> None:
+        """Bound the maximum transit distance by its solved value"""
+        max_distance_solution = self.variables['max_transit_distance'].varValue
+        self._set_epigraph_bound(
+            model, objective, self.variables['max_transit_distance'], pulp.LpConstraintLE,
+            max_distance_solution * (1 + relaxation)
+        )
+
+    def _constrain_max_age(self, model: pulp.LpProblem, objective: str, relaxation: float) -> None:
+        """Bound the maximum age by its solved value"""
+        max_age_solution = self.variables['max_age'].varValue
+        self._set_epigraph_bound(
+            model, objective, self.variables['max_age'], pulp.LpConstraintLE,
+            max_age_solution * (1 + relaxation)
+        )
+
+    def _constrain_capacity(self, model: pulp.LpProblem, objective: str, relaxation: float) -> None:
+        """Hold total capacity at its solved value"""
+        self._drop_demand_constraints(model)
+        total_capacity = self.variables['total_arrived_and_completed_product'].varValue
+        self._set_epigraph_bound(
+            model, objective, self.variables['total_arrived_and_completed_product'], pulp.LpConstraintGE,
+            total_capacity * (1 - relaxation)
+        )
+
+    def _constrain_max_utilization(self, model: pulp.LpProblem, objective: str, relaxation: float) -> None:
+        """Bound the maximum capacity utilization by its solved value"""
+        max_utilization_solution = self.variables['max_capacity_utilization'].varValue
+        self._set_epigraph_bound(
+            model, objective, self.variables['max_capacity_utilization'], pulp.LpConstraintLE,
+            max_utilization_solution * (1 + relaxation)
+        )
+
+    def _constrain_plan_over_plan_change(self, model: pulp.LpProblem, objective: str, relaxation: float) -> None:
+        """Bound the volume moved by its solved value"""
+        vol_moved_solution = self.variables['total_volume_moved'].varValue
+        self._set_epigraph_bound(
+            model, objective, self.variables['total_volume_moved'], pulp.LpConstraintLE,
+            vol_moved_solution * (1 + relaxation)
+        )
+
+    def _constrain_objective_expression(self, model: pulp.LpProblem, objective: str, relaxation: float) -> None:
+        """Bound a stored objective expression by its solved value"""
+        expr = self._exprs[objective]
+        model += (expr <= expr.value() * (1 + relaxation))
+
+    def _set_epigraph_bound(self, model: pulp.LpProblem, objective: str, var: pulp.LpVariable,
+                            sense: int, bound: float) -> None:
+        """Install the named bound on an objective variable, or tighten its RHS if already installed"""
+        name = self._epi_names[objective]
+        constraint = model.constraints.get(name)
+        if constraint is None:
+            model += pulp.LpConstraint(var, sense, name, bound)
+        elif sense == pulp.LpConstraintLE:
+            constraint.changeRHS(min(bound, -constraint.constant))
+        else:
+            constraint.changeRHS(max(bound, -constraint.constant))
@@ -19,10 +19,9 @@ class MILPSolver(BaseSolver):
         """
         results = {}
         
-        # Get ordered objectives
+        # Get objectives grouped by priority, in priority order
         objectives_input = self.input_data['objectives_input']
-        objectives_input_ordered = objectives_input.sort_values(by='Priority')
-        priority_list = objectives_input_ordered['Priority'].unique()
+        priority_groups = list(objectives_input.groupby('Priority', sort=True))
         
         # Build initial model
         model = self.build_model()
@@ -34,27 +33,36 @@ class MILPSolver(BaseSolver):
             gapRel=self.parameters['Gap Limit'][1]
         )
         
+        # Later priorities re-solve the same variables with the previous optimum
+        # added as a constraint, so that optimum is a feasible MIP start
+        warm_solver = pulp.PULP_CBC_CMD(
+            timeLimit=self.parameters['Max Run Time'][1],
+            gapRel=self.parameters['Gap Limit'][1],
+            warmStart=True
+        )
+        
         # Solve with hierarchical objectives
-        for x in priority_list:
-            current_objectives = objectives_input_ordered[objectives_input_ordered['Priority'] == x]
+        for i, (_, current_objectives) in enumerate(priority_groups):
+            objectives = current_objectives['Objective'].tolist()
+            relaxations = current_objectives['Relaxation'].tolist()
+            if i > 0:
+                solver = warm_solver
             
-            if x < max(priority_list):
-                model_w_objective = base_model.copy()
-                for m in current_objectives['Objective']:
-                    self.objective_handler.set_single_objective(model_w_objective, m)
+            if i < len(priority_groups) - 1:
+                for m in objectives:
+                    self.objective_handler.set_single_objective(base_model, m)
                         
                 base_model = self.objective_handler.solve_and_set_constraint(
-                    model_w_objective,
-                    current_objectives['Objective'],
-                    current_objectives['Relaxation'],
+                    base_model,
+                    objectives,
+                    relaxations,
                     solver
                 )
             else:
-                model_w_objective = base_model.copy()
-                for m in current_objectives['Objective']:
-                    self.objective_handler.set_single_objective(model_w_objective, m)
+                for m in objectives:
+                    self.objective_handler.set_single_objective(base_model, m)
                         
-                result = model_w_objective.solve(solver)
+                result = base_model.solve(solver)
                 
         # Process results
         results['model'] = result
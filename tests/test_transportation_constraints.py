@@ -0,0 +1,82 @@
+import pulp
+from optimization.constraints import TransportationConstraints
+from optimization.variables import VariableCreator
+
+
+def _network_sets():
+    return {
+        'NODES': ['DC', 'Store'],
+        'DEPARTING_NODES': ['DC'],
+        'RECEIVING_NODES': ['Store'],
+        'PRODUCTS': ['Small', 'Large'],
+        'PERIODS': ['1', '2'],
+        'MODES': ['Truck'],
+        'MEASURES': ['weight', 'volume'],
+        'NODEGROUPS': ['Hubs'],
+        'TRANSPORTATION_GROUPS': ['Freight'],
+    }
+
+
+def _parameters(**parameters):
+    return {
+        'period_weight': {},
+        'node_in_nodegroup': {('DC', 'Hubs'): 1, ('Store', 'Hubs'): 1},
+        **parameters,
+    }
+
+
+def _variables(network_sets):
+    creator = VariableCreator(network_sets)
+    return {**creator.create_flow_variables(), **creator.create_load_variables()}
+
+
+def test_departed_measures_use_only_their_own_product():
+    network_sets = _network_sets()
+    parameters = _parameters(
+        # Large has no volume measure
+        products_measures={('Small', 'weight'): 2, ('Small', 'volume'): 0.5, ('Large', 'weight'): 30}
+    )
+    variables = _variables(network_sets)
+    departed_by_mode = variables['departed_product_by_mode']
+    departed_measures = variables['departed_measures']
+
+    model = pulp.LpProblem('departed_measures', pulp.LpMinimize)
+    TransportationConstraints(variables, network_sets, parameters)._build_departed_measures_constraints(model)
+
+    for p in network_sets['PRODUCTS']:
+        for u in network_sets['MEASURES']:
+            row = model.constraints[f"DepartedMeasures_DC_Store_{p}_1_Truck_{u}"]
+            assert row.sense == pulp.LpConstraintEQ
+            assert row.constant == 0
+            volume_terms = {
+                v.name: coef for v, coef in row.items()
+                if coef != 0 and v.name.startswith('departed_product_by_mode')
+            }
+            measure = parameters['products_measures'].get((p, u), 0)
+            expected = {departed_by_mode['DC', 'Store', p, '1', 'Truck'].name: -measure} if measure else {}
+            assert volume_terms == expected
+            assert row[departed_measures['DC', 'Store', p, '1', 'Truck', u]] == 1
+
+
+def test_shipping_assembly_rows_follow_the_keyed_period():
+    network_sets = _network_sets()
+    # Keyed (period, origin, destination, origin group, destination group, product 1, product 2)
+    # as ParameterProcessor builds them from the Shipping Assembly Constraints sheet
+    key = ('1', 'DC', 'Store', 'Hubs', 'Hubs', 'Small', 'Large')
+    parameters = _parameters(
+        shipping_assembly_p1_required={key: 4},
+        shipping_assembly_p2_required={key: 1}
+    )
+    variables = _variables(network_sets)
+    departed_by_mode = variables['departed_product_by_mode']
+
+    model = pulp.LpProblem('shipping_assembly', pulp.LpMinimize)
+    TransportationConstraints(variables, network_sets, parameters)._build_shipping_assembly_constraints(model)
+
+    assert list(model.constraints) == ["shipping_volume_assembly_constraints_DC_Store_1_Small_Large_Hubs_Hubs_Truck"]
+    row = model.constraints["shipping_volume_assembly_constraints_DC_Store_1_Small_Large_Hubs_Hubs_Truck"]
+    assert row.sense == pulp.LpConstraintEQ
+    assert dict(row) == {
+        departed_by_mode['DC', 'Store', 'Small', '1', 'Truck']: 4,
+        departed_by_mode['DC', 'Store', 'Large', '1', 'Truck']: -1,
+    }